@@ -1,15 +1,30 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from routers import deals, interviews, investor_chat, auth
+from services.interview_ai import warmup_client
 import firebase_admin
 from firebase_admin import credentials
+import asyncio
+import logging
+
+# INFO in production - module debug logging (e.g. interview state dumps) is skipped entirely
+logging.basicConfig(level=logging.INFO)
 
 # Initialize Firebase Admin
 if not firebase_admin._apps:
     cred = credentials.ApplicationDefault()
     firebase_admin.initialize_app(cred)
 
-app = FastAPI(title="AI Startup Analyst API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background task - don't hold up startup on the network round-trip
+    # Kept on app.state so the task isn't garbage-collected before it finishes
+    app.state.gemini_warmup = asyncio.create_task(warmup_client())
+    yield
+    app.state.gemini_warmup.cancel()
+
+app = FastAPI(title="AI Startup Analyst API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
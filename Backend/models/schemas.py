@@ -151,6 +151,16 @@ class ChatResponse(BaseModel):
     gathered_fields: List[str]
     missing_fields: List[str]
 
+class AnswerAssessment(BaseModel):
+    """Gemini response schema for judging and extracting a founder's answer in one call"""
+    is_relevant: bool
+    reason: str
+    is_joke: bool
+    is_offtopic: bool
+    has_answer: bool
+    value: Optional[str] = None
+    confidence: str  # high, medium, low
+
 # Investment Decision Models
 class FundingTranche(BaseModel):
     tranche_number: int
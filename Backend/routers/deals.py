@@ -1,30 +1,77 @@
-from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, Form, Request
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Depends, Request, Query
+from fastapi.responses import StreamingResponse, ORJSONResponse
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import ValueTarget
 from typing import Optional
 from datetime import datetime
-import io
 import asyncio
 import threading
+from google.api_core.exceptions import NotFound
 from google.cloud import firestore, storage
 from config.settings import settings
 from config.auth import get_current_user
 from models.schemas import WeightageUpdate, FactCheckResponse
 from services import (
     extract_text_from_pdf,
-    extract_metadata_from_text,
     analyze_with_gemini,
     upload_to_gcs,
     generate_deal_id,
     create_word_document
 )
+from services.storage_service import GCSUploadTarget, as_uri, object_path
+from services.chunking import hybrid_chunk
 
-router = APIRouter(prefix="/api", tags=["deals"])
+# Deal payloads carry the full memo - serialize with orjson instead of the stdlib encoder
+router = APIRouter(prefix="/api", tags=["deals"], default_response_class=ORJSONResponse)
 
 # Initialize clients
 db = firestore.Client(project=settings.GCP_PROJECT_ID)
 storage_client = storage.Client(project=settings.GCP_PROJECT_ID)
 bucket = storage_client.bucket(settings.GCS_BUCKET_NAME)
 
+def _apply_updates(data: dict, updates: dict) -> dict:
+    """Apply Firestore dot-notation field updates to a local copy of the document"""
+    for path, value in updates.items():
+        *parents, leaf = path.split('.')
+        target = data
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = value
+    return data
+
+async def _existing_blob(gcs_path: str, missing_detail: str) -> storage.Blob:
+    """
+    Fetch blob metadata before streaming - _stream_blob only opens the object once the response has started,
+    too late to turn a missing file into a 404
+    """
+    blob = bucket.blob(gcs_path)
+    try:
+        await asyncio.to_thread(blob.reload)
+    except NotFound:
+        raise HTTPException(status_code=404, detail=missing_detail)
+    return blob
+
+def _stream_blob(blob, chunk_size: int = 1 << 20):
+    """Yield a GCS blob in fixed-size chunks so downloads never hold the whole file in memory"""
+    with blob.open("rb", chunk_size=chunk_size) as reader:
+        while chunk := reader.read(chunk_size):
+            yield chunk
+
+# Fields the deals list actually renders - projected server-side so the
+# (potentially huge) extracted_text and full memo are never read
+DEAL_LIST_FIELDS = [
+    'metadata',
+    'memo.generated_at',
+    'memo.docx_url',
+    'memo.draft_v1.risk_metrics',
+    'memo.draft_v1.conclusion',
+    'raw_files',
+    'public_data'
+]
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-run
+_background_tasks = set()
+
 def generate_investment_decision_in_background(deal_id: str, memo: dict, extracted_text: str, user_id: str):
     """Thread-based background task to generate investment decision"""
     print(f"[{deal_id}] 🚀 Starting background investment decision generation...")
@@ -57,87 +104,57 @@ def generate_investment_decision_in_background(deal_id: str, memo: dict, extract
 
 @router.post("/upload")
 async def upload_file(
-    file: Optional[UploadFile] = File(None),
-    text_input: Optional[str] = Form(None),
+    request: Request,
     processing_mode: str = "fast",
-    request: Request = None,
     current_user: str = Depends(get_current_user)
 ):
     """
     Upload pitch deck (PDF/Video/Audio) or Text and generate complete analysis
     processing_mode: 'fast' (gemini-2.5-flash, ~1 min) or 'research' (gemini-3-pro-preview, ~2-3 min)
+    The multipart body is streamed straight to GCS - the file is never buffered in memory
     Returns analysis data immediately after memo generation
     Investment Decision generates automatically in background thread (only for research mode)
     """
     try:
         print(f"Received upload request. Processing mode: {processing_mode}")
         
-        # Fallback: Try to retrieve file from form if dependency injection failed
-        if not file and request:
-            try:
-                form = await request.form()
-                print(f"Raw Form Keys: {form.keys()}")
-                if 'file' in form:
-                    file_obj = form['file']
-                    # Check if it's an UploadFile (Starlette/FastAPI)
-                    if hasattr(file_obj, 'filename'):
-                        file = file_obj
-                        print(f"✅ Recovered file from form: {file.filename}")
-            except Exception as e:
-                print(f"Error reading form: {e}")
-
-        print(f"File received: {file}, Filename: {file.filename if file else 'None'}")
-        print(f"Text input received: {text_input[:50] if text_input else 'None'}")
-
         # Validate processing mode
         if processing_mode not in ["fast", "research"]:
             processing_mode = "fast"  # Default to fast if invalid
         
-        # Validate input: either file or text_input must be provided
-        if not file and not text_input:
-            received_keys = []
-            if request:
-                try:
-                    form = await request.form()
-                    received_keys = list(form.keys())
-                except:
-                    pass
-            print(f"❌ Validation failed: No file or text input provided. Keys: {received_keys}")
-            raise HTTPException(status_code=400, detail=f"Either file or text input must be provided. Received keys: {received_keys}")
-            
         deal_id = generate_deal_id()
         
-        # Determine input type and process accordingly
-        pitch_deck_url = ""
-        mime_type = "text/plain"
+        # Stream multipart body: 'file' is uploaded to GCS in fixed-size chunks, 'text_input' is captured in memory
+        file_target = GCSUploadTarget(deal_id)
+        text_target = ValueTarget()
         
-        if file:
-            file_content = await file.read()
-            mime_type = file.content_type
-            
-            # Map common extensions if mime type is generic
-            if mime_type == "application/octet-stream":
-                if file.filename.endswith(".pdf"):
-                    mime_type = "application/pdf"
-                elif file.filename.endswith(".mp4"):
-                    mime_type = "video/mp4"
-                elif file.filename.endswith(".mp3"):
-                    mime_type = "audio/mpeg"
-            
-            # Define GCS path based on type
-            extension = "bin"
-            if "pdf" in mime_type: extension = "pdf"
-            elif "video" in mime_type: extension = "mp4"
-            elif "audio" in mime_type: extension = "mp3"
-            
-            gcs_path = f"deals/{deal_id}/pitch_deck.{extension}"
-            pitch_deck_url = upload_to_gcs(file_content, gcs_path)
-            
+        parser = StreamingFormDataParser(headers=request.headers)
+        parser.register('file', file_target)
+        parser.register('text_input', text_target)
+        
+        # Each chunk may flush a resumable-upload request to GCS - keep that off the event loop
+        async for chunk in request.stream():
+            await asyncio.to_thread(parser.data_received, chunk)
+        
+        text_input = text_target.value.decode('utf-8') if text_target.value else None
+        
+        print(f"File received: {file_target.received}, Filename: {file_target.multipart_filename}")
+        print(f"Text input received: {text_input[:50] if text_input else 'None'}")
+        
+        # Validate input: either file or text_input must be provided
+        if not file_target.received and not text_input:
+            print(f"❌ Validation failed: No file or text input provided")
+            raise HTTPException(status_code=400, detail="Either file or text input must be provided.")
+        
+        # Determine input type
+        if file_target.received:
+            mime_type = file_target.mime_type
+            pitch_deck_url = file_target.gcs_path
         else:
             # Handle text input
-            file_content = text_input.encode('utf-8')
+            mime_type = "text/plain"
             gcs_path = f"deals/{deal_id}/pitch_deck.txt"
-            pitch_deck_url = upload_to_gcs(file_content, gcs_path)
+            pitch_deck_url = upload_to_gcs(text_input.encode('utf-8'), gcs_path)
         
         deal_ref = db.collection('deals').document(deal_id)
         
@@ -172,8 +189,12 @@ async def upload_file(
             "memo": {}
         }
         
+        # Create the deal up front so it shows as "processing" while the analysis runs
         deal_ref.set(initial_data)
         
+        # Processing results are buffered here and committed in one update
+        updates = {}
+        
         # ===== SYNCHRONOUS PROCESSING - WAITS FOR COMPLETION =====
         try:
             print(f"\n{'='*60}")
@@ -189,74 +210,59 @@ async def upload_file(
             # Route to appropriate extraction logic
             if mime_type == "application/pdf":
                 print(f"[{deal_id}] Starting PDF text extraction...")
-                extracted_data = await extract_text_from_pdf(file_content, deal_id)
+                extracted_data = await extract_text_from_pdf(as_uri(pitch_deck_url), deal_id)
             elif mime_type.startswith("video/") or mime_type.startswith("audio/") or mime_type == "text/plain":
                 print(f"[{deal_id}] Starting Gemini multimodal extraction for {mime_type}...")
                 # For Gemini, we need the gs:// URI
-                gcs_uri = pitch_deck_url.replace("https://storage.googleapis.com/", "gs://")
-                # Fix for signed URLs or other formats if needed, but standard upload_to_gcs returns public URL
-                # Assuming upload_to_gcs returns something like https://storage.googleapis.com/bucket/path
-                # We need gs://bucket/path
-                bucket_name = settings.GCS_BUCKET_NAME
-                if f"https://storage.googleapis.com/{bucket_name}/" in pitch_deck_url:
-                    gcs_uri = pitch_deck_url.replace(f"https://storage.googleapis.com/{bucket_name}/", f"gs://{bucket_name}/")
-                
                 from services.document_ai import extract_content_with_gemini
-                extracted_data = await extract_content_with_gemini(gcs_uri, mime_type)
+                extracted_data = await extract_content_with_gemini(as_uri(pitch_deck_url), mime_type)
             else:
                 raise HTTPException(status_code=400, detail=f"Unsupported file type: {mime_type}")
 
             extraction_time = time.time() - step_start
             
-            # Update Firestore with extracted text
-            deal_ref.update({
-                "extracted_text.pitch_deck": extracted_data
-            })
+            updates["extracted_text.pitch_deck"] = extracted_data
             print(f"[{deal_id}] ✅ Text extraction complete - {extracted_data['pages']} pages")
             print(f"[{deal_id}] ⏱️  Extraction Time: {extraction_time:.2f}s\n")
             
-            # Extract metadata (5-10 seconds)
-            step_start = time.time()
-            print(f"[{deal_id}] Extracting metadata...")
-            metadata = await extract_metadata_from_text(extracted_data.get('text', ''))
-            metadata_time = time.time() - step_start
+            text = extracted_data.get('text', '')
             
-            # Update metadata
-            deal_ref.update({
-                "metadata.company_name": metadata.get('company_name', 'Unknown'),
-                "metadata.founder_names": metadata.get('founder_names', []),
-                "metadata.sector": metadata.get('sector', 'Unknown')
-            })
-            print(f"[{deal_id}] ✅ Metadata extracted: {metadata.get('company_name')}")
-            print(f"[{deal_id}] ⏱️  Metadata Time: {metadata_time:.2f}s\n")
+            # Section-aware chunks feed the analysis prompt - not stored, they'd double the text in the 1 MiB doc
+            # No overlap: every chunk lands in the same prompt, so overlap would only repeat text
+            chunks = hybrid_chunk(text, overlap=0)
             
-            # Get current weightage and processing mode
-            deal_data = deal_ref.get().to_dict()
-            weightage = deal_data['metadata']['weightage']
+            # New deals always start with the default weightage written above
+            weightage = initial_data['metadata']['weightage']
             
-            # Analyze with Gemini using appropriate model based on processing mode
+            # Analyze with Gemini - the same call also returns company name, founders and sector
             step_start = time.time()
             model_name = "gemini-2.5-flash" if processing_mode == "fast" else "gemini-3-pro-preview"
             print(f"[{deal_id}] Starting Gemini analysis with {model_name}...")
             analysis = await analyze_with_gemini(
-                extracted_data.get('text', ''), 
+                chunks, 
                 weightage,
                 processing_mode=processing_mode
             )
+            metadata = analysis.pop('metadata', {})
             analysis_time = time.time() - step_start
+            updates.update({
+                "metadata.company_name": metadata.get('company_name', 'Unknown'),
+                "metadata.founder_names": metadata.get('founder_names', []),
+                "metadata.sector": metadata.get('sector', 'Unknown')
+            })
+            print(f"[{deal_id}] ✅ Metadata extracted: {metadata.get('company_name')}")
             print(f"[{deal_id}] ✅ Gemini analysis complete")
             print(f"[{deal_id}] ⏱️  Analysis Time: {analysis_time:.2f}s\n")
             
             # Create Word document (5-10 seconds)
             step_start = time.time()
             print(f"[{deal_id}] Creating Word document...")
-            docx_url = create_word_document(analysis, deal_id)
+            docx_url = await asyncio.to_thread(create_word_document, analysis, deal_id)
             docx_time = time.time() - step_start
             print(f"[{deal_id}] ✅ Word document created")
             print(f"[{deal_id}] ⏱️  Document Time: {docx_time:.2f}s\n")
             
-            # Final update
-            deal_ref.update({
+            updates.update({
                 "memo.draft_v1": analysis,
                 "memo.generated_at": datetime.utcnow().isoformat() + "Z",
                 "memo.docx_url": docx_url,
@@ -264,13 +270,18 @@ async def upload_file(
                 "metadata.processed_at": datetime.utcnow().isoformat() + "Z"
             })
             
+            # Single write for all processing results
+            deal_ref.update(updates)
+            
             print(f"[{deal_id}] ✅ Core processing completed successfully!")
             
             
-            # Generate draft interview questions immediately
-            print(f"[{deal_id}] Generating draft interview questions...")
+            # Generate draft interview questions without holding up the response
+            print(f"[{deal_id}] Generating draft interview questions in background...")
             from services.interview_service import generate_draft_interview
-            generate_draft_interview(deal_id)
+            task = asyncio.create_task(asyncio.to_thread(generate_draft_interview, deal_id))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
             
             # Only generate investment decision for research mode
             if processing_mode == "research":
@@ -278,7 +289,7 @@ async def upload_file(
                 print(f"[{deal_id}] 🚀 Starting investment decision in background thread...")
                 thread = threading.Thread(
                     target=generate_investment_decision_in_background,
-                    args=(deal_id, analysis, extracted_data.get('text', ''), current_user),
+                    args=(deal_id, analysis, text, current_user),
                     daemon=True  # Daemon thread will not block server shutdown
                 )
                 thread.start()
@@ -293,14 +304,14 @@ async def upload_file(
             print(f"{'='*60}\n")
 
             
-            final_deal_data = deal_ref.get().to_dict()
+            # Build the response from what was just written instead of reading it back
+            state = _apply_updates(initial_data, updates)
             
             # Remove extracted_text from response (too large)
-            if 'extracted_text' in final_deal_data:
-                del final_deal_data['extracted_text']
+            state.pop('extracted_text', None)
             
             # Return complete response with all data EXCEPT extracted_text
-            return final_deal_data
+            return state
             
         except Exception as e:
             # Update error status
@@ -359,11 +370,13 @@ async def regenerate_memo(
             )
         
         # Update weightage and status
-        deal_ref.update({
+        reprocessing_updates = {
             "metadata.weightage": weightage.dict(),
             "metadata.status": "reprocessing",
             "metadata.reprocessing_started_at": datetime.utcnow().isoformat() + "Z"
-        })
+        }
+        deal_ref.update(reprocessing_updates)
+        _apply_updates(deal_data, reprocessing_updates)
         
         print(f"[{deal_id}] Recalculating risk_metrics and conclusion with new weightage: {weightage.dict()}")
         
@@ -373,11 +386,14 @@ async def regenerate_memo(
         
         # Recalculate ONLY risk_metrics and conclusion (10-20 seconds)
         # Using both extracted text and existing memo for full context
-        print(f"[{deal_id}] Calling Gemini with full context (extracted text + existing analysis)...")
+        # Chunks are cheap to rebuild from the stored text, so they are never persisted
+        chunks = hybrid_chunk(extracted_text, overlap=0)
+        
+        print(f"[{deal_id}] Calling Gemini with full context (deck chunks + existing analysis)...")
         from services.gemini_service import recalculate_risk_and_conclusion
         recalculated = await recalculate_risk_and_conclusion(
             existing_memo=existing_memo,
-            extracted_text=extracted_text,
+            chunks=chunks,
             weightage=weightage.dict()
         )
         
@@ -389,17 +405,21 @@ async def regenerate_memo(
         
         # Create updated Word document (5-10 seconds)
         print(f"[{deal_id}] Creating updated Word document...")
-        docx_url = create_word_document(updated_memo, deal_id)
+        docx_url = await asyncio.to_thread(create_word_document, updated_memo, deal_id)
         
-        # Update Firestore with updated memo
-        deal_ref.update({
+        completed_at = datetime.utcnow().isoformat() + "Z"
+        memo_updates = {
             "memo.draft_v1": updated_memo,
-            "memo.generated_at": datetime.utcnow().isoformat() + "Z",
+            "memo.generated_at": completed_at,
             "memo.docx_url": docx_url,
             "metadata.status": "processed",
-            "metadata.processed_at": datetime.utcnow().isoformat() + "Z",
-            "metadata.last_weightage_update": datetime.utcnow().isoformat() + "Z"
-        })
+            "metadata.processed_at": completed_at,
+            "metadata.last_weightage_update": completed_at
+        }
+        
+        # Persist the memo first - a failed or slow decision call must not lose it
+        deal_ref.update(memo_updates)
+        _apply_updates(deal_data, memo_updates)
         
         print(f"[{deal_id}] ✅ Recalculation completed - only risk_metrics and conclusion updated")
         
@@ -416,10 +436,12 @@ async def regenerate_memo(
             )
             # Convert Pydantic model to dict for Firestore
             decision_dict = decision.dict() if hasattr(decision, 'dict') else decision
-            deal_ref.update({
+            decision_updates = {
                 "investment_decision": decision_dict,
                 "metadata.investment_decision_generated_at": datetime.utcnow().isoformat() + "Z"
-            })
+            }
+            deal_ref.update(decision_updates)
+            _apply_updates(deal_data, decision_updates)
             print(f"[{deal_id}] ✅ Investment decision regenerated!")
         except Exception as e:
             print(f"[{deal_id}] ⚠️ Failed to regenerate investment decision: {str(e)}")
@@ -427,15 +449,12 @@ async def regenerate_memo(
             traceback.print_exc()
             # Don't fail the entire regeneration if investment decision fails
         
-        # Get final deal data from Firestore (will include updated investment_decision)
-        final_deal_data = deal_ref.get().to_dict()
-        
+        # deal_data mirrors every update written above - no re-read needed
         # Remove extracted_text from response (too large)
-        if 'extracted_text' in final_deal_data:
-            del final_deal_data['extracted_text']
+        deal_data.pop('extracted_text', None)
         
         # Return complete response with all data EXCEPT extracted_text
-        return final_deal_data
+        return deal_data
     
     except HTTPException:
         raise
@@ -486,19 +505,21 @@ async def get_deal(
 @router.get("/deals")
 async def get_all_deals(
     limit: int = 50,
-    offset: int = 0,
+    cursor: Optional[str] = None,
+    offset: int = Query(0, deprecated=True),
     status: Optional[str] = None,
     include_extracted_text: bool = False,
     current_user: str = Depends(get_current_user)
 ):
     """
-    Fetch all deals with optional filtering
-    By default, excludes extracted_text for performance
+    Fetch all deals with optional filtering, newest first
+    By default, returns only the DEAL_LIST_FIELDS projection (no extracted_text or full memo)
+    cursor: pass the previous page's next_cursor (a created_at timestamp) to fetch the next page
+    offset: deprecated - Firestore still reads and bills every skipped document, use cursor instead
     """
     try:
         print(f"Fetching deals for user: {current_user}")
         
-        # Simplified query: just filter by user_id (no composite index needed)
         query = db.collection('deals').where(
             filter=firestore.FieldFilter('metadata.user_id', '==', current_user)
         )
@@ -506,37 +527,39 @@ async def get_all_deals(
         if status:
             query = query.where(filter=firestore.FieldFilter('metadata.status', '==', status))
         
-        # Fetch all results and sort in Python to avoid composite index
-        deals = []
-        stream = query.stream()
+        # Project only the listed fields unless the caller wants everything
+        if not include_extracted_text:
+            query = query.select(DEAL_LIST_FIELDS)
+        
+        # Keyset pagination on created_at (newest first) - see firestore.indexes.json
+        query = query.order_by('metadata.created_at', direction=firestore.Query.DESCENDING)
+        
+        if cursor:
+            query = query.start_after({"metadata": {"created_at": cursor}})
+        elif offset:
+            query = query.offset(offset)
+        
+        query = query.limit(limit)
         
-        for doc in stream:
+        deals = []
+        for doc in query.stream():
             deal_data = doc.to_dict()
             deal_data['id'] = doc.id
-            
-            # Remove extracted_text unless explicitly requested
-            if not include_extracted_text and 'extracted_text' in deal_data:
-                del deal_data['extracted_text']
-            
             deals.append(deal_data)
         
-        # Sort by created_at in Python (descending - newest first)
-        deals.sort(
-            key=lambda x: x.get('metadata', {}).get('created_at', ''),
-            reverse=True
-        )
-        
-        # Apply pagination after sorting
-        paginated_deals = deals[offset:offset + limit]
+        # A full page means there may be more - hand back the last created_at as the cursor
+        next_cursor = None
+        if len(deals) == limit:
+            next_cursor = deals[-1].get('metadata', {}).get('created_at')
         
-        print(f"Found {len(deals)} total deals for user {current_user}, returning {len(paginated_deals)} after pagination")
+        print(f"Returning {len(deals)} deals for user {current_user} (next_cursor: {next_cursor})")
         
         return {
-            "deals": paginated_deals,
-            "count": len(paginated_deals),
-            "total": len(deals),
+            "deals": deals,
+            "count": len(deals),
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
     
     except Exception as e:
@@ -565,19 +588,26 @@ async def delete_deal(
             raise HTTPException(status_code=403, detail="Access denied")
         
         try:
+            gcs_paths = []
+            
             if 'raw_files' in deal_data and 'pitch_deck_url' in deal_data['raw_files']:
-                gcs_path = deal_data['raw_files']['pitch_deck_url'].replace(f"gs://{settings.GCS_BUCKET_NAME}/", "")
-                blob = bucket.blob(gcs_path)
-                blob.delete()
+                gcs_paths.append(object_path(deal_data['raw_files']['pitch_deck_url']))
             
             if 'memo' in deal_data and 'docx_url' in deal_data['memo']:
-                gcs_path = deal_data['memo']['docx_url'].replace(f"gs://{settings.GCS_BUCKET_NAME}/", "")
-                blob = bucket.blob(gcs_path)
-                blob.delete()
+                gcs_paths.append(object_path(deal_data['memo']['docx_url']))
+            
+            # Document AI batch output shards (only present for large decks)
+            gcs_paths.extend(blob.name for blob in bucket.list_blobs(prefix=f"deals/{deal_id}/docai_output/"))
+            
+            # One batched HTTP request for all deletes; missing blobs are ignored
+            if gcs_paths:
+                with storage_client.batch(raise_exception=False):
+                    bucket.delete_blobs(gcs_paths, on_error=lambda blob: None)
         except Exception as e:
             print(f"Error deleting GCS files: {str(e)}")
         
-        deal_ref.delete()
+        # Also removes any sub-collections under the deal
+        db.recursive_delete(deal_ref)
         
         return {
             "message": "Deal deleted successfully",
@@ -611,15 +641,14 @@ async def download_memo(
         if 'memo' not in deal_data or 'docx_url' not in deal_data['memo']:
             raise HTTPException(status_code=404, detail="Memo not yet generated")
         
-        gcs_path = deal_data['memo']['docx_url'].replace(f"gs://{settings.GCS_BUCKET_NAME}/", "")
-        blob = bucket.blob(gcs_path)
-        file_content = blob.download_as_bytes()
+        gcs_path = object_path(deal_data['memo']['docx_url'])
+        blob = await _existing_blob(gcs_path, "Memo file not found")
         
         company_name = deal_data['metadata'].get('company_name', 'Unknown')
         filename = f"{company_name}_Investment_Memo_{deal_id}.docx"
         
         return StreamingResponse(
-            io.BytesIO(file_content),
+            _stream_blob(blob),
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -644,15 +673,14 @@ async def download_pitch_deck(deal_id: str):
         if 'raw_files' not in deal_data or 'pitch_deck_url' not in deal_data['raw_files']:
             raise HTTPException(status_code=404, detail="Pitch deck not found")
         
-        gcs_path = deal_data['raw_files']['pitch_deck_url'].replace(f"gs://{settings.GCS_BUCKET_NAME}/", "")
-        blob = bucket.blob(gcs_path)
-        file_content = blob.download_as_bytes()
+        gcs_path = object_path(deal_data['raw_files']['pitch_deck_url'])
+        blob = await _existing_blob(gcs_path, "Pitch deck file not found")
         
         company_name = deal_data['metadata'].get('company_name', 'Unknown')
         filename = f"{company_name}_Pitch_Deck_{deal_id}.pdf"
         
         return StreamingResponse(
-            io.BytesIO(file_content),
+            _stream_blob(blob),
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
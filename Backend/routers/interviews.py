@@ -1,11 +1,14 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from models.schemas import InitiateInterviewRequest, ChatMessage, ChatResponse
 from services.interview_service import create_interview, validate_interview_token, complete_interview
-from services.interview_ai import chat_with_founder
+from services.interview_ai import chat_with_founder, stream_chat_with_founder
+from services import json_utils
 from services.email_service import send_interview_email
 from google.cloud import firestore
 from config.settings import settings
 from datetime import datetime
+import asyncio
 
 router = APIRouter(prefix="/api/interviews", tags=["interviews"])
 db = firestore.Client(project=settings.GCP_PROJECT_ID)
@@ -261,12 +264,128 @@ async def validate_interview(token: str):
 #         print(f"Error in chat: {str(e)}")
 #         raise HTTPException(status_code=500, detail=str(e))
 
+def _record_turn(interview: dict, user_message: str, response: dict) -> ChatResponse:
+    """Persist a chat turn (both messages + interview tracking fields) and build the API response"""
+    deal_id = interview['deal_id']
+    
+    deal_ref = db.collection('deals').document(deal_id)
+    
+    # Create new messages
+    new_messages = [
+        {
+            "role": "user",
+            "message": user_message,
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        },
+        {
+            "role": "assistant",
+            "message": response['message'],
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        }
+    ]
+    
+    # Get all tracking fields from response
+    gathered_info = response.get('gathered_info', {})
+    cannot_answer = response.get('cannot_answer_fields', [])
+    asked_questions = response.get('asked_questions', [])
+    ask_count = response.get('ask_count', {})
+    progress = response.get('progress', {})
+    is_complete = response.get('is_complete', False)
+    
+    # Build updates with dot notation for nested interview field
+    updates = {
+        'interview.chat_history': firestore.ArrayUnion(new_messages),
+        'interview.gathered_info': gathered_info,
+        'interview.asked_questions': asked_questions,
+        'interview.ask_count': ask_count,
+        'interview.progress': progress,
+        'interview.is_complete': is_complete,
+        'interview.updated_at': datetime.utcnow().isoformat() + "Z"
+    }
+    
+    # Handle cannot_answer fields
+    if cannot_answer:
+        # Merge with existing cannot_answer
+        existing_cannot_answer = interview.get('cannot_answer_fields', [])
+        all_cannot_answer = list(set(existing_cannot_answer + cannot_answer))
+        
+        print(f"\n📊 Cannot answer tracking:")
+        print(f"   - Existing: {existing_cannot_answer}")
+        print(f"   - New from this turn: {cannot_answer}")
+        print(f"   - Total: {all_cannot_answer}")
+        
+        updates['interview.cannot_answer_fields'] = all_cannot_answer
+        
+        # Update missing_fields: remove both answered AND cannot_answer
+        current_missing = interview.get('missing_fields', [])
+        gathered_fields = list(gathered_info.keys())
+        
+        new_missing = [
+            f for f in current_missing 
+            if f not in gathered_fields and f not in all_cannot_answer
+        ]
+        
+        updates['interview.missing_fields'] = new_missing
+        
+        print(f"\n📋 Missing fields update:")
+        print(f"   - Was: {len(current_missing)} fields")
+        print(f"   - Now: {len(new_missing)} fields")
+    
+    # Apply updates to Firestore
+    deal_ref.update(updates)
+    
+    print(f"\n✅ Firestore updated")
+    print(f"   - Chat history: +2 messages")
+    print(f"   - Gathered: {len(gathered_info)} fields")
+    print(f"   - Cannot answer: {len(cannot_answer)} fields")
+    print(f"   - Progress: {progress.get('attempted', 0)}/{progress.get('total', 0)}")
+    print(f"   - Complete: {is_complete}")
+    
+    # Prepare response for frontend
+    gathered_fields = list(gathered_info.keys())
+    
+    # Still missing = not gathered AND not cannot_answer
+    all_fields = [issue['field'] for issue in interview.get('issues', [])]
+    attempted_fields = gathered_info.keys() | frozenset(cannot_answer)
+    still_missing = [f for f in all_fields if f not in attempted_fields]
+    
+    print(f"\n📤 Sending response:")
+    print(f"   - Message: {response['message'][:80]}...")
+    print(f"   - Gathered: {len(gathered_fields)} fields")
+    print(f"   - Still missing: {len(still_missing)} fields")
+    print(f"   - Complete: {is_complete}")
+    print(f"{'='*60}\n")
+    
+    return ChatResponse(
+        message=response['message'],
+        is_complete=is_complete,
+        gathered_fields=gathered_fields,
+        missing_fields=still_missing
+    )
+
+async def _save_turn(interview: dict, user_message: str, response: dict) -> ChatResponse:
+    """
+    Write the turn off the event loop, then finalize a completed interview back on it
+    complete_interview schedules memo regeneration on the running loop, so it can't run in the worker thread
+    """
+    chat_response = await asyncio.to_thread(_record_turn, interview, user_message, response)
+    
+    # If complete, finalize and regenerate memo
+    if chat_response.is_complete:
+        deal_id = interview['deal_id']
+        print(f"\n🎉 Interview complete for deal {deal_id}!")
+        print(f"🔄 Triggering memo regeneration...")
+        
+        complete_interview(deal_id, response.get('gathered_info', {}))
+    
+    return chat_response
+
 @router.post("/chat")
 async def chat(message: ChatMessage) -> ChatResponse:
     """Handle chat message from founder"""
     try:
         # Validate token and get interview data
-        interview = validate_interview_token(message.interview_token)
+        interview = await asyncio.to_thread(validate_interview_token, message.interview_token)
         deal_id = interview['deal_id']
         
         print(f"\n{'='*60}")
@@ -283,109 +402,7 @@ async def chat(message: ChatMessage) -> ChatResponse:
             chat_history=interview.get('chat_history', [])
         )
         
-        deal_ref = db.collection('deals').document(deal_id)
-        
-        # Create new messages
-        new_messages = [
-            {
-                "role": "user",
-                "message": message.message,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
-            },
-            {
-                "role": "assistant",
-                "message": response['message'],
-                "timestamp": datetime.utcnow().isoformat() + "Z"
-            }
-        ]
-        
-        # Get all tracking fields from response
-        gathered_info = response.get('gathered_info', {})
-        cannot_answer = response.get('cannot_answer_fields', [])
-        asked_questions = response.get('asked_questions', [])
-        ask_count = response.get('ask_count', {})
-        progress = response.get('progress', {})
-        is_complete = response.get('is_complete', False)
-        
-        # Build updates with dot notation for nested interview field
-        updates = {
-            'interview.chat_history': firestore.ArrayUnion(new_messages),
-            'interview.gathered_info': gathered_info,
-            'interview.asked_questions': asked_questions,
-            'interview.ask_count': ask_count,
-            'interview.progress': progress,
-            'interview.is_complete': is_complete,
-            'interview.updated_at': datetime.utcnow().isoformat() + "Z"
-        }
-        
-        # Handle cannot_answer fields
-        if cannot_answer:
-            # Merge with existing cannot_answer
-            existing_cannot_answer = interview.get('cannot_answer_fields', [])
-            all_cannot_answer = list(set(existing_cannot_answer + cannot_answer))
-            
-            print(f"\n📊 Cannot answer tracking:")
-            print(f"   - Existing: {existing_cannot_answer}")
-            print(f"   - New from this turn: {cannot_answer}")
-            print(f"   - Total: {all_cannot_answer}")
-            
-            updates['interview.cannot_answer_fields'] = all_cannot_answer
-            
-            # Update missing_fields: remove both answered AND cannot_answer
-            current_missing = interview.get('missing_fields', [])
-            gathered_fields = list(gathered_info.keys())
-            
-            new_missing = [
-                f for f in current_missing 
-                if f not in gathered_fields and f not in all_cannot_answer
-            ]
-            
-            updates['interview.missing_fields'] = new_missing
-            
-            print(f"\n📋 Missing fields update:")
-            print(f"   - Was: {len(current_missing)} fields")
-            print(f"   - Now: {len(new_missing)} fields")
-        
-        # Apply updates to Firestore
-        deal_ref.update(updates)
-        
-        print(f"\n✅ Firestore updated")
-        print(f"   - Chat history: +2 messages")
-        print(f"   - Gathered: {len(gathered_info)} fields")
-        print(f"   - Cannot answer: {len(cannot_answer)} fields")
-        print(f"   - Progress: {progress.get('attempted', 0)}/{progress.get('total', 0)}")
-        print(f"   - Complete: {is_complete}")
-        
-        # If complete, finalize and regenerate memo
-        if is_complete:
-            print(f"\n🎉 Interview complete for deal {deal_id}!")
-            print(f"🔄 Triggering memo regeneration...")
-            
-            complete_interview(deal_id, gathered_info)
-        
-        # Prepare response for frontend
-        gathered_fields = list(gathered_info.keys())
-        
-        # Still missing = not gathered AND not cannot_answer
-        all_fields = [issue['field'] for issue in interview.get('issues', [])]
-        still_missing = [
-            f for f in all_fields 
-            if f not in gathered_fields and f not in cannot_answer
-        ]
-        
-        print(f"\n📤 Sending response:")
-        print(f"   - Message: {response['message'][:80]}...")
-        print(f"   - Gathered: {len(gathered_fields)} fields")
-        print(f"   - Still missing: {len(still_missing)} fields")
-        print(f"   - Complete: {is_complete}")
-        print(f"{'='*60}\n")
-        
-        return ChatResponse(
-            message=response['message'],
-            is_complete=is_complete,
-            gathered_fields=gathered_fields,
-            missing_fields=still_missing
-        )
+        return await _save_turn(interview, message.message, response)
     
     except ValueError as e:
         print(f"❌ Validation error: {str(e)}")
@@ -397,6 +414,48 @@ async def chat(message: ChatMessage) -> ChatResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/chat/stream")
+async def chat_stream(message: ChatMessage):
+    """
+    Same as /chat, but streams Sarah's reply as server-sent events
+    - data: {"delta": "..."} for each chunk of text as Gemini generates it
+    - data: {"done": true, ...ChatResponse} once the turn is saved
+    """
+    try:
+        interview = await asyncio.to_thread(validate_interview_token, message.interview_token)
+        
+        print(f"\n💬 NEW CHAT MESSAGE (stream) - Deal ID: {interview['deal_id']}")
+        
+        result, reply = await stream_chat_with_founder(
+            interview_data=interview,
+            user_message=message.message,
+            chat_history=interview.get('chat_history', [])
+        )
+    except ValueError as e:
+        print(f"❌ Validation error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"❌ Error in chat: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def events():
+        parts = []
+        try:
+            async for text in reply:
+                parts.append(text)
+                yield f"data: {json_utils.dumps({'delta': text})}\n\n"
+            
+            # Save only after the full reply is known so chat_history stays consistent
+            response = {**result, "message": "".join(parts).strip()}
+            chat_response = await _save_turn(interview, message.message, response)
+            yield f"data: {json_utils.dumps({'done': True, **chat_response.dict()})}\n\n"
+        except Exception as e:
+            print(f"❌ Error in chat stream: {str(e)}")
+            yield f"data: {json_utils.dumps({'error': str(e)})}\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/status/{deal_id}")
 async def get_interview_status(deal_id: str):
     """Get interview status"""
@@ -1,4 +1,4 @@
-from .document_ai import extract_text_from_pdf, extract_metadata_from_text
+from .document_ai import extract_text_from_pdf
 from .gemini_service import analyze_with_gemini, chat_with_ai, recalculate_risk_and_conclusion
 from .storage_service import upload_to_gcs, generate_deal_id
 from .email_service import send_interview_email
@@ -10,7 +10,6 @@ from .investment_decision_service import generate_investment_decision
 
 __all__ = [
     'extract_text_from_pdf',
-    'extract_metadata_from_text',
     'analyze_with_gemini',
     'recalculate_risk_and_conclusion',
     'chat_with_ai',
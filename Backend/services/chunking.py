@@ -0,0 +1,93 @@
+from typing import List
+import re
+
+# Split on the coarsest boundary that fits: paragraphs, then lines, then sentences, then words
+_SEPARATORS = ["\n\n", "\n", ". ", " "]
+
+def _split(text: str, size: int, separators: List[str]) -> List[str]:
+    """Recursively split text into pieces no longer than size"""
+    if len(text) <= size:
+        return [text]
+
+    if not separators:
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    separator, rest = separators[0], separators[1:]
+    # Keep the separator on each part so chunks concatenate back into the original text
+    parts = text.split(separator)
+    parts = [part + separator for part in parts[:-1]] + [parts[-1]]
+
+    pieces = []
+    for part in parts:
+        if len(part) > size:
+            pieces.extend(_split(part, size, rest))
+        elif part:
+            pieces.append(part)
+
+    return pieces
+
+# A sentence or line ends here - where a partial final section may be cut
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|\n")
+
+def _cut_at_sentence(text: str, limit: int) -> str:
+    """Longest prefix of text within limit that ends on a sentence or line boundary ('' if there is none)"""
+    if len(text) <= limit:
+        return text
+    ends = [match.end() for match in _SENTENCE_END_RE.finditer(text, 0, max(limit, 0))]
+    return text[:ends[-1]].rstrip() if ends else ""
+
+def hybrid_chunk(text: str, size: int = 4000, overlap: int = 200) -> List[str]:
+    """
+    Split extracted deck text into ~size-char chunks
+    - Splits on paragraph breaks first, recursively falling back to lines/sentences/words for oversize blocks
+    - Merges tiny pieces (single slide titles, bullets) into their neighbours up to size
+    - Prefixes each chunk after the first with the last `overlap` chars of the previous chunk
+    """
+    if not text or not text.strip():
+        return []
+
+    chunks = []
+    current = ""
+    for piece in _split(text, size, _SEPARATORS):
+        if len(current) + len(piece) <= size:
+            current += piece
+        else:
+            chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+
+    chunks = [chunk.strip() for chunk in chunks if chunk.strip()]
+
+    if overlap <= 0:
+        return chunks
+
+    return [chunks[0]] + [
+        chunks[i - 1][-overlap:] + "\n" + chunks[i]
+        for i in range(1, len(chunks))
+    ]
+
+def build_context(chunks: List[str], budget: int) -> str:
+    """
+    Join chunks into prompt context, each under a heading taken from its first line
+    Once the character budget runs out, the last section is cut at a sentence boundary instead of mid-sentence
+    Pass chunks built with overlap=0 - in a single prompt the overlap would only repeat text
+    """
+    sections = []
+    used = 0
+    for i, chunk in enumerate(chunks, start=1):
+        heading = chunk.lstrip().split("\n", 1)[0][:80]
+        header = f"### Section {i}: {heading}\n"
+        # Sections are joined with a blank line
+        remaining = budget - used - (2 if sections else 0)
+        if len(header) + len(chunk) <= remaining:
+            sections.append(header + chunk)
+            used += len(sections[-1]) + (2 if len(sections) > 1 else 0)
+            continue
+        
+        body = _cut_at_sentence(chunk, remaining - len(header))
+        if body:
+            sections.append(header + body)
+        break
+
+    return "\n\n".join(sections)
@@ -1,155 +1,226 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from google import genai
 from google.cloud import documentai_v1 as documentai
-from google.api_core.client_options import ClientOptions
+from google.cloud import storage
+from google.cloud.documentai_v1.services.document_processor_service.transports import DocumentProcessorServiceGrpcTransport
 from fastapi import HTTPException
 from config.settings import settings
-from .storage_service import upload_to_gcs
-import json
+from .storage_service import bucket
+from .pdf_fast import fast_extract_blob, is_text_native
+import asyncio
+import re
 
-async def extract_text_from_pdf(file_content: bytes, deal_id: str) -> Dict[str, Any]:
+# Batch (async) processing has no 30-page ceiling but takes longer - give it room
+BATCH_TIMEOUT_SECONDS = 600
+
+# Keep the cached gRPC channel from going idle (and re-handshaking) between uploads
+# A custom channel drops the library's unlimited message sizes - restore them for large decks
+_DOCAI_CHANNEL_OPTIONS = [
+    ("grpc.client_idle_timeout_ms", 60 * 60 * 1000),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+@lru_cache(maxsize=1)
+def _docai_client() -> documentai.DocumentProcessorServiceClient:
+    """Process-wide Document AI client - reuses one gRPC channel instead of a TLS handshake per call"""
+    api_endpoint = f"{settings.DOCUMENT_AI_LOCATION}-documentai.googleapis.com"
+    channel = DocumentProcessorServiceGrpcTransport.create_channel(
+        f"{api_endpoint}:443",
+        options=_DOCAI_CHANNEL_OPTIONS
+    )
+    transport = DocumentProcessorServiceGrpcTransport(host=api_endpoint, channel=channel)
+    return documentai.DocumentProcessorServiceClient(transport=transport)
+
+@lru_cache(maxsize=None)
+def _genai_client(project: str, location: str) -> genai.Client:
+    """Cached Vertex AI Gen AI client per (project, location)"""
+    return genai.Client(
+        vertexai=True,
+        project=project,
+        location=location
+    )
+
+def _processor_name() -> str:
+    return f"projects/{settings.GCP_PROJECT_ID}/locations/{settings.DOCUMENT_AI_LOCATION}/processors/{settings.DOCUMENT_AI_PROCESSOR_ID}"
+
+def _shard_index(blob_name: str) -> int:
+    match = re.search(r"-(\d+)\.json$", blob_name)
+    return int(match.group(1)) if match else 0
+
+def _load_batch_output(output_prefix: str) -> List[documentai.Document]:
+    """
+    List, download and parse the batch output shards - blocking GCS I/O, run it in a worker thread
+    Output shards are named <name>-<shard index>.json - stitched back in order
+    """
+    shard_blobs = [
+        blob for blob in bucket.list_blobs(prefix=output_prefix)
+        if blob.name.endswith(".json")
+    ]
+    shard_blobs.sort(key=lambda blob: _shard_index(blob.name))
+    
+    return [
+        documentai.Document.from_json(blob.download_as_bytes(), ignore_unknown_fields=True)
+        for blob in shard_blobs
+    ]
+
+def _to_extracted_data(documents: List[documentai.Document]) -> Dict[str, Any]:
+    """Flatten one or more Document AI documents (batch output is sharded) into extracted_data"""
+    extracted_data = {
+        "text": "".join(document.text for document in documents),
+        "pages": sum(len(document.pages) for document in documents),
+        # Keyed dicts, not tuples - Firestore rejects arrays nested directly in arrays
+        "entities": [
+            {
+                "type": entity.type_,
+                "mention_text": entity.mention_text,
+                "confidence": entity.confidence
+            }
+            for document in documents
+            for entity in document.entities
+        ]
+    }
+    
+    print(f"Extracted {len(extracted_data['entities'])} entities")
+    
+    return extracted_data
+
+async def _fast_extract_from_gcs(gcs_uri: str, deal_id: str) -> Optional[Dict[str, Any]]:
     """
-    Extract text from PDF using Document AI synchronous processing with imageless mode
-    Fast: completes in 10-30 seconds for 16-30 page documents
+    Read the PDF's embedded text layer with PyMuPDF
+    Returns None when the deck looks scanned (too little text per page) or can't be parsed
     """
     try:
-        # Upload to GCS (for reference/backup)
-        gcs_path = f"deals/{deal_id}/pitch_deck.pdf"
-        gcs_uri = upload_to_gcs(file_content, gcs_path)
-        
+        blob = storage.Blob.from_string(gcs_uri, client=bucket.client)
+        text, pages = await asyncio.to_thread(fast_extract_blob, blob)
+    except Exception as e:
+        print(f"PyMuPDF fast path failed for deal {deal_id}: {str(e)}")
+        return None
+    
+    if not is_text_native(text, pages):
+        print(f"Sparse text layer for deal {deal_id} ({len(text.strip())} chars / {pages} pages), using Document AI OCR")
+        return None
+    
+    print(f"PyMuPDF extracted {len(text)} chars from {pages} pages for deal {deal_id}")
+    return {
+        "text": text,
+        "pages": pages,
+        "entities": []
+    }
+
+async def extract_text_from_pdf(gcs_uri: str, deal_id: str) -> Dict[str, Any]:
+    """
+    Extract text from PDF, trying the embedded text layer (PyMuPDF) first
+    Falls back to Document AI synchronous processing with imageless mode for scanned decks
+    Reads the pitch deck directly from GCS (already uploaded by the upload stream)
+    Fast path: milliseconds for text-native decks; Document AI: 10-30 seconds for 16-30 page documents
+    """
+    extracted_data = await _fast_extract_from_gcs(gcs_uri, deal_id)
+    if extracted_data is not None:
+        return extracted_data
+    
+    try:
         print(f"Starting Document AI processing for deal {deal_id} (imageless mode)...")
         
-        # Initialize Document AI client
-        opts = ClientOptions(
-            api_endpoint=f"{settings.DOCUMENT_AI_LOCATION}-documentai.googleapis.com"
-        )
-        client = documentai.DocumentProcessorServiceClient(client_options=opts)
+        client = _docai_client()
         
         # Configure the process request
-        processor_name = f"projects/{settings.GCP_PROJECT_ID}/locations/{settings.DOCUMENT_AI_LOCATION}/processors/{settings.DOCUMENT_AI_PROCESSOR_ID}"
+        processor_name = _processor_name()
         
-        # Create raw document
-        raw_document = documentai.RawDocument(
-            content=file_content,
+        # Point Document AI at the uploaded object instead of sending raw bytes
+        gcs_document = documentai.GcsDocument(
+            gcs_uri=gcs_uri,
             mime_type="application/pdf"
         )
         
         # Create request with imageless_mode enabled
         request = documentai.ProcessRequest(
             name=processor_name,
-            raw_document=raw_document,
+            gcs_document=gcs_document,
             skip_human_review=True,
             imageless_mode=True,  # ✅ Enables support for up to 30 pages
         )
         
         print(f"Sending synchronous request to Document AI with imageless_mode=True...")
         
-        # Process document synchronously (returns in 10-30 seconds)
-        result = client.process_document(request=request)
+        # Process document synchronously (returns in 10-30 seconds) off the event loop
+        result = await asyncio.to_thread(client.process_document, request=request)
         document = result.document
         
         print(f"Document AI processing completed! Pages: {len(document.pages)}")
         
         # Extract text and structure
-        extracted_data = {
-            "text": document.text,
-            "pages": len(document.pages),
-            "entities": []
-        }
-        
-        # Extract entities if available
-        for entity in document.entities:
-            extracted_data["entities"].append({
-                "type": entity.type_,
-                "mention_text": entity.mention_text,
-                "confidence": entity.confidence
-            })
-        
-        print(f"Extracted {len(extracted_data['entities'])} entities")
-        
-        return extracted_data
+        return _to_extracted_data([document])
     
     except Exception as e:
         error_msg = str(e)
         print(f"Error in Document AI extraction: {error_msg}")
         
-        # Check if it's a page limit error
+        # Decks over the 30-page sync limit go through batch processing instead
         if "PAGE_LIMIT_EXCEEDED" in error_msg or "pages exceed the limit" in error_msg.lower():
-            raise HTTPException(
-                status_code=400, 
-                detail="Document exceeds 30-page limit for fast processing. Please use a smaller document or contact support for batch processing."
-            )
+            print(f"Page limit exceeded for deal {deal_id}, falling back to batch processing...")
+            return await batch_extract_text_from_pdf(gcs_uri, deal_id)
         
         raise HTTPException(status_code=500, detail=f"Failed to extract text: {error_msg}")
 
-async def extract_metadata_from_text(text: str) -> Dict[str, Any]:
-    """Extract company name, founders, and sector from text using Gemini"""
-    from google import genai
-    from config.settings import settings
-    
+async def batch_extract_text_from_pdf(gcs_uri: str, deal_id: str, timeout: int = BATCH_TIMEOUT_SECONDS) -> Dict[str, Any]:
+    """
+    Extract text from PDF using Document AI batch (async) processing
+    No page ceiling: Google shards the output JSON into GCS, which is stitched back together here
+    The long-running operation is awaited in an executor so the event loop stays free
+    """
     try:
-        # Use the same client as gemini_service
-        client = genai.Client(
-            vertexai=True,
-            project=settings.GCP_PROJECT_ID,
-            location=settings.GCP_LOCATION
-        )
+        print(f"Starting Document AI batch processing for deal {deal_id}...")
         
-        prompt = f"""
-        Extract the following information from this pitch deck text:
-        1. Company name
-        2. List of founder names
-        3. Primary sector/industry
-        
-        Text:
-        {text[:10000]}
-        
-        Return ONLY a JSON object with this structure:
-        {{
-            "company_name": "extracted name",
-            "founder_names": ["founder1", "founder2"],
-            "sector": "primary sector"
-        }}
-        """
+        client = _docai_client()
         
-        response = client.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=prompt
+        output_prefix = f"deals/{deal_id}/docai_output/"
+        
+        request = documentai.BatchProcessRequest(
+            name=_processor_name(),
+            input_documents=documentai.BatchDocumentsInputConfig(
+                gcs_documents=documentai.GcsDocuments(
+                    documents=[documentai.GcsDocument(gcs_uri=gcs_uri, mime_type="application/pdf")]
+                )
+            ),
+            document_output_config=documentai.DocumentOutputConfig(
+                gcs_output_config=documentai.DocumentOutputConfig.GcsOutputConfig(
+                    gcs_uri=f"gs://{settings.GCS_BUCKET_NAME}/{output_prefix}"
+                )
+            ),
+            skip_human_review=True,
         )
         
-        response_text = response.text.strip()
+        operation = client.batch_process_documents(request=request)
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, operation.result, timeout)
+        
+        documents = await asyncio.to_thread(_load_batch_output, output_prefix)
         
-        if response_text.startswith("```json"):
-            response_text = response_text[7:-3]
-        elif response_text.startswith("```"):
-            response_text = response_text[3:-3]
+        if not documents:
+            raise ValueError("Batch processing produced no output")
         
-        metadata = json.loads(response_text)
-        return metadata
+        print(f"Document AI batch processing completed! Shards: {len(documents)}")
+        
+        return _to_extracted_data(documents)
     
     except Exception as e:
-        print(f"Error extracting metadata: {str(e)}")
-        return {
-            "company_name": "Unknown",
-            "founder_names": [],
-            "sector": "Unknown"
-        }
+        error_msg = str(e)
+        print(f"Error in Document AI batch extraction: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Failed to extract text: {error_msg}")
 
 async def extract_content_with_gemini(gcs_uri: str, mime_type: str) -> Dict[str, Any]:
     """
     Extract content from Video, Audio, or Text files using Gemini 1.5 Flash
     """
-    from google import genai
     from google.genai import types
-    from config.settings import settings
     
     try:
         print(f"Starting Gemini extraction for {mime_type} file at {gcs_uri}...")
         
-        client = genai.Client(
-            vertexai=True,
-            project=settings.GCP_PROJECT_ID,
-            location=settings.GCP_LOCATION
-        )
+        client = _genai_client(settings.GCP_PROJECT_ID, settings.GCP_LOCATION)
         
         # Create the part from GCS URI
         file_part = types.Part.from_uri(
@@ -175,7 +246,8 @@ async def extract_content_with_gemini(gcs_uri: str, mime_type: str) -> Dict[str,
         Output the result as a single block of text that can be used for downstream analysis.
         """
         
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model='gemini-2.5-flash',
             contents=[file_part, prompt]
         )
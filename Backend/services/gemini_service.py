@@ -1,18 +1,68 @@
+import asyncio
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
 from fastapi import HTTPException
 from google import genai
 from google.genai.types import GenerateContentConfig, Tool, GoogleSearch
 from config.settings import settings
+from . import json_utils
+from .json_utils import strip_fences
+from .chunking import build_context
+
+# Character budgets for deck content packed into each prompt
+ANALYSIS_CONTEXT_CHARS = 50000
+RECALCULATION_CONTEXT_CHARS = 15000
 
 # Initialize Google Gen AI client with API Key
 client = genai.Client(
     api_key=settings.GEMINI_API_KEY
 )
 
-async def analyze_with_gemini(extracted_text: str, weightage: Dict[str, int], processing_mode: str = "fast") -> Dict[str, Any]:
+def _validate_metadata(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Enforce the metadata shape {company_name: str, founder_names: [str], sector: str}
+    Search grounding rules out response_mime_type/response_schema on the analysis call,
+    so missing or malformed fields are backfilled from company_overview instead of 'Unknown'
+    """
+    metadata = analysis.get('metadata')
+    if not isinstance(metadata, dict):
+        metadata = {}
+    overview = analysis.get('company_overview')
+    if not isinstance(overview, dict):
+        overview = {}
+    
+    company_name = metadata.get('company_name')
+    if not isinstance(company_name, str) or not company_name.strip():
+        company_name = overview.get('name') if isinstance(overview.get('name'), str) else ''
+    
+    sector = metadata.get('sector')
+    if not isinstance(sector, str) or not sector.strip():
+        sector = overview.get('sector') if isinstance(overview.get('sector'), str) else ''
+    
+    founder_names = metadata.get('founder_names')
+    if isinstance(founder_names, str):
+        founder_names = [founder_names]
+    if not isinstance(founder_names, list) or not founder_names:
+        # The model may return "founders": null - treat anything but a list as no founders
+        founders = overview.get('founders')
+        if not isinstance(founders, list):
+            founders = []
+        founder_names = [
+            founder.get('name') for founder in founders
+            if isinstance(founder, dict) and founder.get('name')
+        ]
+    
+    return {
+        "company_name": company_name.strip() or "Unknown",
+        "founder_names": [str(name).strip() for name in founder_names if name and str(name).strip()],
+        "sector": sector.strip() or "Unknown"
+    }
+
+async def analyze_with_gemini(chunks: List[str], weightage: Dict[str, int], processing_mode: str = "fast") -> Dict[str, Any]:
     """
     Analyze pitch deck content using Gemini with Google Search grounding
+    chunks: extracted deck text from hybrid_chunk - packed into the prompt by section, not a raw dump
+    Also returns deal metadata (company_name, founder_names, sector) under the 'metadata' key
     processing_mode: 'fast' uses gemini-2.5-flash, 'research' uses gemini-3-pro-preview
     """
     try:
@@ -83,11 +133,16 @@ async def analyze_with_gemini(extracted_text: str, weightage: Dict[str, int], pr
         3. Prioritize analysis depth for higher-weighted factors
         
         Pitch Deck Content:
-        {extracted_text[:50000]}
+        {build_context(chunks, ANALYSIS_CONTEXT_CHARS)}
         
         Provide a detailed analysis in the following JSON structure. Use Google Search to find real market data, competitor information, and industry reports:
         
         {{
+            "metadata": {{
+                "company_name": "extracted company name",
+                "founder_names": ["founder1", "founder2"],
+                "sector": "primary sector/industry"
+            }},
             "company_overview": {{
                 "name": "extracted company name",
                 "sector": "primary sector/industry",
@@ -236,7 +291,7 @@ async def analyze_with_gemini(extracted_text: str, weightage: Dict[str, int], pr
         # Select model based on processing mode
         model_name = "gemini-2.5-flash" if processing_mode == "fast" else "gemini-3-pro-preview"
         
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=model_name,
             contents=prompt,
             config=GenerateContentConfig(
@@ -250,20 +305,15 @@ async def analyze_with_gemini(extracted_text: str, weightage: Dict[str, int], pr
         )
         
         # Parse JSON response
-        response_text = response.text.strip()
-        
         # Remove markdown formatting if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:-3].strip()
-        elif response_text.startswith("```"):
-            response_text = response_text[3:-3].strip()
+        response_text = strip_fences(response.text)
         
         # Parse JSON
-        analysis = json.loads(response_text)
+        analysis = json_utils.loads(response_text)
         
         # Validate required fields (risk fields optional for fast mode)
         required_fields = [
-            'company_overview', 'market_analysis', 'business_model',
+            'metadata', 'company_overview', 'market_analysis', 'business_model',
             'financials', 'claims_analysis', 'conclusion'
         ]
         
@@ -275,6 +325,8 @@ async def analyze_with_gemini(extracted_text: str, weightage: Dict[str, int], pr
                 print(f"Warning: Missing required field: {field}")
                 analysis[field] = {}
         
+        analysis['metadata'] = _validate_metadata(analysis)
+        
         # Add weightage metadata to the analysis
         analysis['_weightage_used'] = weightage
         
@@ -296,12 +348,12 @@ async def analyze_with_gemini(extracted_text: str, weightage: Dict[str, int], pr
 
 async def recalculate_risk_and_conclusion(
     existing_memo: Dict[str, Any], 
-    extracted_text: str,
+    chunks: List[str],
     weightage: Dict[str, int]
 ) -> Dict[str, Any]:
     """
     Recalculate ONLY risk_metrics and conclusion based on new weightage
-    Uses both extracted text and existing memo for full context
+    Uses both the deck chunks and existing memo for full context
     Keeps all other sections unchanged
     """
     try:
@@ -313,22 +365,22 @@ async def recalculate_risk_and_conclusion(
 You are a VC analyst recalculating risk assessment with NEW weightage.
 
 ORIGINAL PITCH DECK CONTENT (for reference):
-{extracted_text[:15000]}
+{build_context(chunks, RECALCULATION_CONTEXT_CHARS)}
 
 EXISTING ANALYSIS:
 Company: {company_name} | Sector: {sector}
 
 Team:
-{json.dumps(existing_memo.get('company_overview', {}), indent=2)[:1000]}
+{json_utils.dumps(existing_memo.get('company_overview', {}))[:1000]}
 
 Market:
-{json.dumps(existing_memo.get('market_analysis', {}), indent=2)[:2000]}
+{json_utils.dumps(existing_memo.get('market_analysis', {}))[:2000]}
 
 Financials:
-{json.dumps(existing_memo.get('financials', {}), indent=2)[:1000]}
+{json_utils.dumps(existing_memo.get('financials', {}))[:1000]}
 
 Claims:
-{json.dumps(existing_memo.get('claims_analysis', []), indent=2)[:1000]}
+{json_utils.dumps(existing_memo.get('claims_analysis', []))[:1000]}
 
 NEW WEIGHTAGE (total=100%):
 - Team Strength: {weightage.get('team_strength', 20)}%
@@ -369,7 +421,8 @@ Return ONLY this JSON (complete all fields):
 CRITICAL: Return ONLY valid complete JSON. No markdown.
 """
         
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model='gemini-3-pro-preview',
             contents=prompt,
             config=GenerateContentConfig(
@@ -380,16 +433,11 @@ CRITICAL: Return ONLY valid complete JSON. No markdown.
         )
         
         # Parse JSON response
-        response_text = response.text.strip()
-        
         # Remove markdown formatting if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:-3].strip()
-        elif response_text.startswith("```"):
-            response_text = response_text[3:-3].strip()
+        response_text = strip_fences(response.text)
         
         # Parse JSON
-        recalculated = json.loads(response_text)
+        recalculated = json_utils.loads(response_text)
         
         # Validate required fields
         if 'risk_metrics' not in recalculated:
@@ -430,7 +478,7 @@ async def chat_with_ai(memo: Dict[str, Any], company_name: str, sector: str, cha
         Sector: {sector}
         
         Current Investment Memo Summary:
-        {json.dumps(memo, indent=2)[:5000]}
+        {json_utils.dumps(memo)[:5000]}
         
         Your goal is to gather missing or unclear information to complete the investment analysis.
         Focus on:
@@ -445,14 +493,15 @@ async def chat_with_ai(memo: Dict[str, Any], company_name: str, sector: str, cha
         Be professional, concise, and focused. Ask one question at a time.
         
         Chat History:
-        {json.dumps(chat_history[-10:], indent=2)}
+        {json_utils.dumps(chat_history[-10:])}
         
         Founder's latest message: {user_message}
         
         Respond naturally and ask relevant follow-up questions.
         """
         
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model='gemini-3-pro-preview',
             contents=context
         )
@@ -487,7 +536,7 @@ async def generate_investor_chat_response(
         CONTEXT:
         
         1. INVESTMENT MEMO SUMMARY:
-        {json.dumps(memo_context, indent=2)[:5000]}
+        {json_utils.dumps(memo_context)[:5000]}
         
         2. RAW PITCH DECK CONTENT (Excerpt):
         {extracted_text[:10000]}
@@ -506,7 +555,8 @@ async def generate_investor_chat_response(
         - Do not hallucinate facts about the startup.
         """
         
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model='gemini-2.5-flash',
             contents=prompt,
             config=GenerateContentConfig(
@@ -600,7 +650,8 @@ async def verify_claims_with_google(extracted_text: str) -> Dict[str, Any]:
         }}
         """
         
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model='gemini-3-pro-preview',
             contents=prompt,
             config=GenerateContentConfig(
@@ -609,13 +660,9 @@ async def verify_claims_with_google(extracted_text: str) -> Dict[str, Any]:
             )
         )
         
-        response_text = response.text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:-3]
-        elif response_text.startswith("```"):
-            response_text = response_text[3:-3]
+        response_text = strip_fences(response.text)
             
-        return json.loads(response_text)
+        return json_utils.loads(response_text)
         
     except Exception as e:
         print(f"Error in fact check generation: {str(e)}")
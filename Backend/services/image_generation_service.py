@@ -37,7 +37,8 @@ async def generate_deal_cover_art(deal_id: str, company_name: str, sector: str,
         # Note: The exact method call might vary depending on the library version.
         # Using the standard generate_images method for Imagen.
         
-        response = client.models.generate_images(
+        response = await asyncio.to_thread(
+            client.models.generate_images,
             model='imagen-3.0-generate-001',
             prompt=prompt,
             config=genai.types.GenerateImagesConfig(
@@ -368,14 +368,24 @@ Reliable Interview System with Answer Validation
 - Re-asks up to 2 times for irrelevant answers
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai.types import GenerateContentConfig
 from config.settings import settings
-import json
+from models.schemas import AnswerAssessment
+from . import json_utils
+from collections import OrderedDict
+from string import Template
+import asyncio
+import hashlib
+import logging
+import random
 import re
 
 
+logger = logging.getLogger(__name__)
+
 client = genai.Client(
     vertexai=True,
     project=settings.GCP_PROJECT_ID,
@@ -383,20 +393,305 @@ client = genai.Client(
 )
 
 
+# Cap in-flight Gemini calls per process so a burst of chats doesn't trip Vertex quota (429s)
+GENAI_CONCURRENCY = 32
+GENAI_MAX_ATTEMPTS = 3
+_genai_semaphore = asyncio.Semaphore(GENAI_CONCURRENCY)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for a rate-limited Gemini call"""
+    return 0.5 * 2 ** attempt + random.uniform(0, 0.25)
+
+
+async def _generate_content(**kwargs):
+    """
+    client.aio.models.generate_content behind the concurrency cap
+    Retries 429 RESOURCE_EXHAUSTED with exponential backoff + jitter; other errors raise immediately
+    """
+    for attempt in range(GENAI_MAX_ATTEMPTS):
+        try:
+            async with _genai_semaphore:
+                return await client.aio.models.generate_content(**kwargs)
+        except genai_errors.APIError as e:
+            if e.code != 429 or attempt == GENAI_MAX_ATTEMPTS - 1:
+                raise
+            delay = _retry_delay(attempt)
+            logger.info("Gemini rate limited, retrying in %.2fs", delay)
+            await asyncio.sleep(delay)
+
+
+async def _stream_content(**kwargs) -> AsyncIterator[Any]:
+    """
+    client.aio.models.generate_content_stream behind the concurrency cap
+    The slot is held for the whole stream - the connection stays busy until the last chunk
+    A 429 surfaces before the first chunk, so opening the stream is retried like _generate_content;
+    errors after that raise - text has already reached the caller
+    """
+    for attempt in range(GENAI_MAX_ATTEMPTS):
+        async with _genai_semaphore:
+            try:
+                stream = await client.aio.models.generate_content_stream(**kwargs)
+                first = await anext(stream, None)
+            except genai_errors.APIError as e:
+                if e.code != 429 or attempt == GENAI_MAX_ATTEMPTS - 1:
+                    raise
+                delay = _retry_delay(attempt)
+            else:
+                if first is not None:
+                    yield first
+                async for chunk in stream:
+                    yield chunk
+                return
+        # Back off outside the semaphore so the slot isn't held while sleeping
+        logger.info("Gemini stream rate limited, retrying in %.2fs", delay)
+        await asyncio.sleep(delay)
+
+
+async def warmup_client():
+    """
+    Prime DNS/TLS/OAuth on the shared async client with a trivial count_tokens call
+    Run at startup so a cold Cloud Run instance doesn't pay it on the founder's first turn
+    """
+    try:
+        await client.aio.models.count_tokens(model='gemini-2.5-flash', contents='x')
+        logger.info("Gemini client warmed up")
+    except Exception as e:
+        logger.warning("Gemini client warmup failed: %s", e)
+
+
+# ===== STATIC PROMPTS =====
+# Invariant instructions go in system_instruction so every call shares the same prefix
+# (eligible for Gemini implicit caching); only the per-turn fields are sent as contents
+
+VALIDATION_INSTRUCTIONS = """
+You are validating if a founder's answer is relevant to the question asked.
+
+Determine if the answer is:
+1. ON-TOPIC and relevant to the question
+2. OFF-TOPIC, random, joke, or irrelevant
+
+Return JSON:
+{
+    "is_relevant": true/false,
+    "reason": "brief explanation",
+    "is_joke": true/false,
+    "is_offtopic": true/false
+}
+
+Examples:
+Q: "What is your monthly revenue?"
+A: "Around $50k per month" → {"is_relevant": true, "reason": "Direct answer with numbers", "is_joke": false, "is_offtopic": false}
+
+Q: "What is your monthly revenue?"  
+A: "The sky is blue and cats are cool" → {"is_relevant": false, "reason": "Completely unrelated", "is_joke": false, "is_offtopic": true}
+
+Q: "How many employees do you have?"
+A: "lol idk probably like a million" → {"is_relevant": false, "reason": "Joke/sarcastic answer", "is_joke": true, "is_offtopic": false}
+
+Q: "What is your customer acquisition cost?"
+A: "I'm hungry, let's talk about pizza" → {"is_relevant": false, "reason": "Off-topic, avoiding question", "is_joke": false, "is_offtopic": true}
+
+Be strict. Mark as irrelevant if:
+- Joke/sarcastic
+- Random unrelated response
+- Deliberately avoiding the question
+- Nonsense/gibberish
+"""
+
+EXTRACTION_INSTRUCTIONS = """
+You are analyzing a founder's response to extract specific information.
+
+Extract ONLY if the answer contains specific, concrete information.
+
+Return JSON:
+{
+    "has_answer": true/false,
+    "value": "extracted specific value or null",
+    "confidence": "high/medium/low"
+}
+
+Rules:
+- has_answer = true ONLY if specific data provided (numbers, names, facts)
+- has_answer = false if vague, uncertain, or no clear answer
+- value = null if has_answer is false
+- confidence high = very specific answer
+- confidence medium = somewhat specific
+- confidence low = vague but something mentioned
+
+Examples:
+"We have 5 engineers" → {"has_answer": true, "value": "5 engineers", "confidence": "high"}
+"Maybe around 10-15 people" → {"has_answer": true, "value": "10-15 people", "confidence": "medium"}
+"We're still figuring it out" → {"has_answer": false, "value": null, "confidence": "low"}
+"I don't know" → {"has_answer": false, "value": null, "confidence": "low"}
+"""
+
+ASSESSMENT_INSTRUCTIONS = """
+You are reviewing a founder's answer to an interview question. In one pass:
+
+1. RELEVANCE - is the answer on-topic for the question asked?
+   Be strict. Mark as irrelevant (is_relevant = false) if it is:
+   - Joke/sarcastic (is_joke = true)
+   - Random unrelated response, or deliberately avoiding the question (is_offtopic = true)
+   - Nonsense/gibberish
+   reason = brief explanation
+
+2. EXTRACTION - does it contain specific, concrete information for the field?
+   - has_answer = true ONLY if specific data provided (numbers, names, facts)
+   - has_answer = false if vague, uncertain, no clear answer, or irrelevant
+   - value = the extracted specific value, null if has_answer is false
+   - confidence high = very specific answer, medium = somewhat specific, low = vague
+
+Examples:
+Q: "What is your monthly revenue?" A: "Around $50k per month"
+→ {"is_relevant": true, "reason": "Direct answer with numbers", "is_joke": false, "is_offtopic": false, "has_answer": true, "value": "$50k per month", "confidence": "high"}
+
+Q: "How many engineers do you have?" A: "Maybe around 10-15 people"
+→ {"is_relevant": true, "reason": "Approximate headcount", "is_joke": false, "is_offtopic": false, "has_answer": true, "value": "10-15 people", "confidence": "medium"}
+
+Q: "What is your go-to-market plan?" A: "We're still figuring it out"
+→ {"is_relevant": true, "reason": "On-topic but no plan given", "is_joke": false, "is_offtopic": false, "has_answer": false, "value": null, "confidence": "low"}
+
+Q: "How many employees do you have?" A: "lol idk probably like a million"
+→ {"is_relevant": false, "reason": "Joke/sarcastic answer", "is_joke": true, "is_offtopic": false, "has_answer": false, "value": null, "confidence": "low"}
+
+Q: "What is your customer acquisition cost?" A: "I'm hungry, let's talk about pizza"
+→ {"is_relevant": false, "reason": "Off-topic, avoiding question", "is_joke": false, "is_offtopic": true, "has_answer": false, "value": null, "confidence": "low"}
+"""
+
+SARAH_INSTRUCTIONS = """
+You are Sarah, a friendly investment analyst having a natural conversation with a startup founder.
+
+YOUR TASK:
+1. Briefly acknowledge their answer (1 sentence, be natural)
+2. Smoothly transition to the next question
+3. Ask the NEXT QUESTION TO ASK given in the turn details
+
+RULES:
+1. Be warm, conversational, human-like
+2. Acknowledge their answer briefly (1 sentence, be natural)
+3. THEN ASK THE NEXT QUESTION (required!)
+4. If they said "don't know", acknowledge kindly and move on
+5. If their answer was off-topic or irrelevant:
+   - Gently redirect: "That's interesting, but let me ask about [topic]..."
+   - Don't be rude, stay friendly
+6. One question at a time, 40-80 words total
+7. Make it feel like coffee chat, not interrogation
+8. MUST end with asking the next question
+
+Respond with the acknowledgment + next question only.
+"""
+
+
+CLOSING_INSTRUCTIONS = """
+You are Sarah, a friendly investment analyst who has just finished interviewing a startup founder.
+
+Write a warm closing message (60-80 words) that:
+1. Thanks them for their time
+2. Mentions you'll update the investment memo
+3. Says you'll get back within 2-3 weeks
+4. Encourages them about their company
+
+Be warm, professional, genuine. DO NOT ask any more questions.
+
+Respond with the closing message only.
+"""
+
+# Per-call fields, compiled once - substituted into contents alongside the static instructions above
+ANSWER_TEMPLATE = Template("""
+QUESTION ASKED: "$question"
+FIELD NAME: $field_name
+FOUNDER'S ANSWER: "$user_message"
+""")
+
+# Ordered from most to least stable across a session's turns (after the static system
+# instruction) so consecutive requests share the longest possible prefix
+TURN_TEMPLATE = Template("""
+## SESSION
+FOUNDER: $founder_name
+COMPANY: $company_name
+
+RECENT CONVERSATION:
+$conversation_context
+
+## THIS TURN
+PROGRESS: $answered answered, $remaining remaining
+FOUNDER'S LATEST: "$user_message"
+NEXT QUESTION TO ASK: "$next_question"
+CATEGORY: $category$reask_context
+""")
+
+CLOSING_TEMPLATE = Template("""
+FOUNDER: $founder_name
+COMPANY: $company_name
+TOPICS COVERED: $total
+FOUNDER'S LAST MESSAGE: "$user_message"
+""")
+
+
+# ===== RESPONSE CACHE =====
+
+class ResponseCache:
+    """
+    Bounded LRU cache of LLM classification results keyed on (task, field, question hash, normalized answer)
+    Founders re-send the same short answers across turns and sessions - these skip the Gemini call
+    The question is part of the key: the same answer can be relevant to one wording and not another
+    """
+    
+    def __init__(self, max_size: int = 2048):
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split()).rstrip(".!?")
+    
+    @staticmethod
+    def key(task: str, field: str, question: str, user_message: str) -> tuple:
+        question_hash = hashlib.blake2b(ResponseCache._normalize(question).encode(), digest_size=8).hexdigest()
+        return (task, field, question_hash, ResponseCache._normalize(user_message))
+    
+    def get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        result = self._entries.get(key)
+        if result is None:
+            return None
+        self._entries.move_to_end(key)
+        return dict(result)
+    
+    def put(self, key: tuple, result: Dict[str, Any]):
+        self._entries[key] = dict(result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+response_cache = ResponseCache()
+
+
 # ===== STATE MANAGEMENT =====
 
 class InterviewState:
     """Clear state tracking for interview progress"""
     
+    # Fixed attribute set - no per-instance __dict__, faster attribute access on the per-turn path
+    __slots__ = (
+        'company_name', 'founder_name',
+        'all_issues', 'gathered_info', 'cannot_answer', 'asked_questions', 'ask_count', 'all_fields'
+    )
+    
     def __init__(self, interview_data: Dict[str, Any]):
+        # Session constants - read from the interview document once
+        self.company_name = interview_data.get('company_name', 'your startup')
+        self.founder_name = interview_data.get('founder_name', 'Founder')
+        
         self.all_issues = interview_data.get('issues', [])
         self.gathered_info = interview_data.get('gathered_info', {})
         self.cannot_answer = set(interview_data.get('cannot_answer_fields', []))
         self.asked_questions = set(interview_data.get('asked_questions', []))
         self.ask_count = interview_data.get('ask_count', {})
         
-        # Get all field names
-        self.all_fields = [issue['field'] for issue in self.all_issues]
+        # Get all field names (frozenset - only used for membership and counting)
+        self.all_fields = frozenset(issue['field'] for issue in self.all_issues)
         
     def get_ask_count(self, field: str) -> int:
         """Get how many times we've asked this question"""
@@ -451,7 +746,7 @@ class InterviewState:
     def get_progress(self) -> Dict[str, Any]:
         """Get current progress - PURE MATH, NO LLM"""
         total = len(self.all_fields)
-        answered = len([f for f in self.gathered_info.keys() if f in self.all_fields])
+        answered = len(self.gathered_info.keys() & self.all_fields)
         cannot = len(self.cannot_answer)
         attempted = answered + cannot
         
@@ -464,18 +759,44 @@ class InterviewState:
             'is_complete': attempted >= total  # ✅ DETERMINISTIC COMPLETION
         }
     
+    def pending_issues(self) -> List[Dict[str, Any]]:
+        """Issues neither answered nor marked cannot-answer, in interview order"""
+        return [
+            issue for issue in self.all_issues
+            if issue['field'] not in self.gathered_info and issue['field'] not in self.cannot_answer
+        ]
+    
     def get_remaining_questions(self) -> List[str]:
         """Get list of questions still to ask"""
-        remaining = []
-        for issue in self.all_issues:
-            field = issue['field']
-            if field not in self.gathered_info and field not in self.cannot_answer:
-                remaining.append(field)
-        return remaining
+        return [issue['field'] for issue in self.pending_issues()]
 
 
 # ===== RESPONSE ANALYSIS =====
 
+# Whole-message skips ("idk", "pass", "n/a") - too short for the substance check, no LLM needed
+IDK_PATTERN = re.compile(
+    r"^\s*(i\s*don'?t\s*know|idk|dunno|no\s*idea|pass|skip|next|n/?a|not\s*sure|no\s*comment)\s*[.!?]*\s*$",
+    re.IGNORECASE
+)
+
+# Bare figures ("50k", "$1.2M", "12 employees") - a complete answer to a numeric question on their own
+NUMERIC_ANSWER_PATTERN = re.compile(
+    r"^\s*(~|about|around|approx\.?)?\s*[$€£₹]?\s*\d[\d,.]*\s*"
+    r"(k|m|mm|b|bn|%|x|thousand|million|billion|lakh|crore|people|employees|users|customers|months|years)?\s*[.!]?\s*$",
+    re.IGNORECASE
+)
+
+# Field-id terms whose answer is a single figure - issue ids are free-form ("current_mrr", "team_size"),
+# so a field counts as numeric when any of its words is in this set
+NUMERIC_FIELD_TERMS = frozenset({
+    'revenue', 'arr', 'mrr', 'burn', 'runway', 'headcount', 'employees', 'size', 'count',
+    'customers', 'users', 'cac', 'ltv', 'margin', 'churn', 'valuation', 'raised', 'tam', 'sam', 'som',
+})
+
+def is_numeric_field(field: str) -> bool:
+    """True when a bare figure is a complete answer for this field"""
+    return not NUMERIC_FIELD_TERMS.isdisjoint(re.split(r'[^a-z0-9]+', field.lower()))
+
 def analyze_user_response(user_message: str) -> Dict[str, Any]:
     """
     Simple pattern matching to detect:
@@ -498,7 +819,9 @@ def analyze_user_response(user_message: str) -> Dict[str, Any]:
         r"\bno clue\b"
     ]
     
-    is_dont_know = any(re.search(pattern, message_lower) for pattern in dont_know_patterns)
+    is_dont_know = bool(IDK_PATTERN.match(message_lower)) or any(
+        re.search(pattern, message_lower) for pattern in dont_know_patterns
+    )
     
     # Detect if response has substance (numbers, facts)
     has_numbers = bool(re.search(r'\d+', user_message))
@@ -509,6 +832,7 @@ def analyze_user_response(user_message: str) -> Dict[str, Any]:
     
     return {
         'is_dont_know': is_dont_know,
+        'is_numeric_answer': bool(NUMERIC_ANSWER_PATTERN.match(user_message)),
         'has_substance': has_substance,
         'has_numbers': has_numbers,
         'numbers': numbers,
@@ -526,50 +850,19 @@ async def validate_answer_relevance(
     Catches random/irrelevant/joke answers
     """
     
-    prompt = f"""
-You are validating if a founder's answer is relevant to the question asked.
-
-QUESTION ASKED: "{question}"
-FIELD: {field_name}
-FOUNDER'S ANSWER: "{user_message}"
-
-Determine if the answer is:
-1. ON-TOPIC and relevant to the question
-2. OFF-TOPIC, random, joke, or irrelevant
-
-Return JSON:
-{{
-    "is_relevant": true/false,
-    "reason": "brief explanation",
-    "is_joke": true/false,
-    "is_offtopic": true/false
-}}
-
-Examples:
-Q: "What is your monthly revenue?"
-A: "Around $50k per month" → {{"is_relevant": true, "reason": "Direct answer with numbers", "is_joke": false, "is_offtopic": false}}
-
-Q: "What is your monthly revenue?"  
-A: "The sky is blue and cats are cool" → {{"is_relevant": false, "reason": "Completely unrelated", "is_joke": false, "is_offtopic": true}}
-
-Q: "How many employees do you have?"
-A: "lol idk probably like a million" → {{"is_relevant": false, "reason": "Joke/sarcastic answer", "is_joke": true, "is_offtopic": false}}
-
-Q: "What is your customer acquisition cost?"
-A: "I'm hungry, let's talk about pizza" → {{"is_relevant": false, "reason": "Off-topic, avoiding question", "is_joke": false, "is_offtopic": true}}
-
-Be strict. Mark as irrelevant if:
-- Joke/sarcastic
-- Random unrelated response
-- Deliberately avoiding the question
-- Nonsense/gibberish
-"""
+    cache_key = ResponseCache.key("validate", field_name, question, user_message)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    prompt = ANSWER_TEMPLATE.substitute(question=question, field_name=field_name, user_message=user_message)
     
     try:
-        response = client.models.generate_content(
+        response = await _generate_content(
             model='gemini-2.5-flash',
             contents=prompt,
             config=GenerateContentConfig(
+                system_instruction=VALIDATION_INSTRUCTIONS,
                 temperature=0.1,
                 response_mime_type="application/json",
                 max_output_tokens=5000
@@ -577,10 +870,11 @@ Be strict. Mark as irrelevant if:
         )
         
         if response and hasattr(response, 'text') and response.text:
-            result = json.loads(response.text.strip())
+            result = json_utils.loads(response.text)
+            response_cache.put(cache_key, result)
             return result
     except Exception as e:
-        print(f"❌ Validation error: {e}")
+        logger.warning("Validation error: %s", e)
     
     # Default to relevant if validation fails (benefit of doubt)
     return {
@@ -601,60 +895,87 @@ async def extract_info_from_response(
     Only called if response seems to have substance
     """
     
-    prompt = f"""
-You are analyzing a founder's response to extract specific information.
-
-QUESTION ASKED: "{question}"
-FIELD NAME: {current_field}
-FOUNDER'S ANSWER: "{user_message}"
-
-Extract ONLY if the answer contains specific, concrete information.
-
-Return JSON:
-{{
-    "has_answer": true/false,
-    "value": "extracted specific value or null",
-    "confidence": "high/medium/low"
-}}
+    cache_key = ResponseCache.key("extract", current_field, question, user_message)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    prompt = ANSWER_TEMPLATE.substitute(question=question, field_name=current_field, user_message=user_message)
+    
+    try:
+        response = await _generate_content(
+            model='gemini-2.5-flash',
+            contents=prompt,
+            config=GenerateContentConfig(
+                system_instruction=EXTRACTION_INSTRUCTIONS,
+                temperature=0.1,
+                response_mime_type="application/json",
+                max_output_tokens=5000
+            )
+        )
+        
+        if response and hasattr(response, 'text') and response.text:
+            result = json_utils.loads(response.text)
+            response_cache.put(cache_key, result)
+            return result
+    except Exception as e:
+        logger.warning("Extraction error: %s", e)
+    
+    return None
 
-Rules:
-- has_answer = true ONLY if specific data provided (numbers, names, facts)
-- has_answer = false if vague, uncertain, or no clear answer
-- value = null if has_answer is false
-- confidence high = very specific answer
-- confidence medium = somewhat specific
-- confidence low = vague but something mentioned
 
-Examples:
-"We have 5 engineers" → {{"has_answer": true, "value": "5 engineers", "confidence": "high"}}
-"Maybe around 10-15 people" → {{"has_answer": true, "value": "10-15 people", "confidence": "medium"}}
-"We're still figuring it out" → {{"has_answer": false, "value": null, "confidence": "low"}}
-"I don't know" → {{"has_answer": false, "value": null, "confidence": "low"}}
-"""
+async def assess_answer(
+    user_message: str,
+    current_field: str,
+    question: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Validate relevance AND extract the field value in a single schema-constrained call
+    Returns None on failure so the caller can fall back to the separate validate/extract calls
+    """
+    
+    cache_key = ResponseCache.key("assess", current_field, question, user_message)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    prompt = ANSWER_TEMPLATE.substitute(question=question, field_name=current_field, user_message=user_message)
     
     try:
-        response = client.models.generate_content(
+        response = await _generate_content(
             model='gemini-2.5-flash',
             contents=prompt,
             config=GenerateContentConfig(
+                system_instruction=ASSESSMENT_INSTRUCTIONS,
                 temperature=0.1,
                 response_mime_type="application/json",
+                response_schema=AnswerAssessment,
                 max_output_tokens=5000
             )
         )
         
         if response and hasattr(response, 'text') and response.text:
-            result = json.loads(response.text.strip())
+            result = json_utils.loads(response.text)
+            response_cache.put(cache_key, result)
             return result
     except Exception as e:
-        print(f"❌ Extraction error: {e}")
+        logger.warning("Assessment error: %s", e)
     
     return None
 
 
 # ===== CONVERSATIONAL AI =====
 
-async def generate_conversational_response(
+# Trailing sentence punctuation/whitespace - swapped for "?" when a reply must end on the question
+_END_PUNCT_RE = re.compile(r"[.!\s]*$")
+
+# Messages of prior conversation a turn ever looks at (last question asked + reply context)
+HISTORY_WINDOW = 6
+
+# Fills in whatever the next question doesn't carry (or all of it when there is none)
+DEFAULT_NEXT_QUESTION = {'question': "Tell me more?", 'category': 'General', 'ask_count': 0}
+
+def _conversation_request(
     state: InterviewState,
     user_message: str,
     next_question: Optional[Dict[str, Any]],
@@ -663,40 +984,31 @@ async def generate_conversational_response(
     founder_name: str,
     chat_history: List[Dict[str, str]],
     was_irrelevant: bool = False
-) -> str:
-    """
-    Generate natural conversational response
-    """
+) -> Tuple[str, Optional[str]]:
+    """Build the (prompt, system_instruction) pair for Sarah's next message"""
     
     progress = state.get_progress()
     
     if is_closing:
         # Closing message
-        prompt = f"""
-You are Sarah, a friendly investment analyst. You just finished interviewing {founder_name} about {company_name}.
-
-We've covered all {progress['total']} topics. Write a warm closing message (60-80 words) that:
-1. Thanks them for their time
-2. Mentions you'll update the investment memo
-3. Says you'll get back within 2-3 weeks
-4. Encourages them about their company
-
-Founder's last message: "{user_message}"
-
-Be warm, professional, genuine. DO NOT ask any more questions.
-
-Closing message:
-"""
+        system_instruction = CLOSING_INSTRUCTIONS
+        prompt = CLOSING_TEMPLATE.substitute(
+            founder_name=founder_name,
+            company_name=company_name,
+            total=progress['total'],
+            user_message=user_message
+        )
     else:
         # Normal conversation with next question
-        next_q_text = next_question['question'] if next_question else "Tell me more?"
-        category = next_question.get('category', 'General') if next_question else 'General'
-        ask_count = next_question.get('ask_count', 0) if next_question else 0
+        question = {**DEFAULT_NEXT_QUESTION, **(next_question or {})}
+        next_q_text = question['question']
+        category = question['category']
+        ask_count = question['ask_count']
         
-        recent_history = chat_history[-6:] if len(chat_history) > 6 else chat_history
+        # chat_history is already trimmed to HISTORY_WINDOW by _process_turn
         conversation_context = "\n".join([
             f"{'Analyst' if m['role'] == 'assistant' else 'Founder'}: {m['message']}"
-            for m in recent_history
+            for m in chat_history
         ])
         
         # Add context if this is a re-ask
@@ -706,42 +1018,61 @@ Closing message:
         elif ask_count > 0:
             reask_context = f"\nNOTE: This is attempt #{ask_count + 1} for this question. Be patient but direct."
         
-        prompt = f"""
-You are Sarah, a friendly investment analyst having a natural conversation with {founder_name} about {company_name}.
-
-PROGRESS: {progress['answered']} answered, {progress['remaining']} remaining
-FOUNDER'S LATEST: "{user_message}"
-NEXT QUESTION TO ASK: "{next_q_text}"
-CATEGORY: {category}{reask_context}
+        system_instruction = SARAH_INSTRUCTIONS
+        prompt = TURN_TEMPLATE.substitute(
+            founder_name=founder_name,
+            company_name=company_name,
+            answered=progress['answered'],
+            remaining=progress['remaining'],
+            user_message=user_message,
+            next_question=next_q_text,
+            category=category,
+            reask_context=reask_context,
+            conversation_context=conversation_context
+        )
+    
+    return prompt, system_instruction
 
-RECENT CONVERSATION:
-{conversation_context}
 
-YOUR TASK:
-1. Briefly acknowledge their answer (1 sentence, be natural)
-2. Smoothly transition to the next question
-3. Ask: "{next_q_text}"
+def _fallback_response(
+    next_question: Optional[Dict[str, Any]],
+    is_closing: bool,
+    company_name: str,
+    founder_name: str
+) -> str:
+    """Canned message used when Gemini fails or returns nothing"""
+    if is_closing:
+        return f"Thank you so much for your time, {founder_name}! I'll update our investment memo and get back to you within 2-3 weeks. Best of luck with {company_name}!"
+    else:
+        next_q = next_question['question'] if next_question else "What else can you tell me?"
+        return f"Thanks for sharing! {next_q}"
 
-RULES:
-1. Be warm, conversational, human-like
-2. Acknowledge their answer briefly (1 sentence, be natural)
-3. THEN ASK THE NEXT QUESTION (required!)
-4. If they said "don't know", acknowledge kindly and move on
-5. If their answer was off-topic or irrelevant:
-   - Gently redirect: "That's interesting, but let me ask about [topic]..."
-   - Don't be rude, stay friendly
-6. One question at a time, 40-80 words total
-7. Make it feel like coffee chat, not interrogation
-8. MUST end with asking the next question
 
-Response (acknowledgment + next question):
-"""
+async def generate_conversational_response(
+    state: InterviewState,
+    user_message: str,
+    next_question: Optional[Dict[str, Any]],
+    is_closing: bool,
+    company_name: str,
+    founder_name: str,
+    chat_history: List[Dict[str, str]],
+    was_irrelevant: bool = False
+) -> str:
+    """
+    Generate natural conversational response
+    """
+    
+    prompt, system_instruction = _conversation_request(
+        state, user_message, next_question, is_closing,
+        company_name, founder_name, chat_history, was_irrelevant
+    )
     
     try:
-        response = client.models.generate_content(
+        response = await _generate_content(
             model='gemini-2.5-flash',
             contents=prompt,
             config=GenerateContentConfig(
+                system_instruction=system_instruction,
                 temperature=0.8,
                 max_output_tokens=5000
             )
@@ -750,90 +1081,139 @@ Response (acknowledgment + next question):
         if response and hasattr(response, 'text') and response.text:
             ai_message = response.text.strip()
             
-            # Ensure question mark if not closing
+            # Ensure question mark if not closing - replacing a trailing "." or "!" rather than stacking on it
             if not is_closing and not ai_message.endswith('?'):
-                ai_message += '?'
+                ai_message = _END_PUNCT_RE.sub('', ai_message) + '?'
             
             return ai_message
     except Exception as e:
-        print(f"❌ Conversation error: {e}")
+        logger.warning("Conversation error: %s", e)
     
     # Fallback
-    if is_closing:
-        return f"Thank you so much for your time, {founder_name}! I'll update our investment memo and get back to you within 2-3 weeks. Best of luck with {company_name}!"
-    else:
-        next_q = next_question['question'] if next_question else "What else can you tell me?"
-        return f"Thanks for sharing! {next_q}"
+    return _fallback_response(next_question, is_closing, company_name, founder_name)
+
+
+async def stream_conversational_response(
+    state: InterviewState,
+    user_message: str,
+    next_question: Optional[Dict[str, Any]],
+    is_closing: bool,
+    company_name: str,
+    founder_name: str,
+    chat_history: List[Dict[str, str]],
+    was_irrelevant: bool = False
+) -> AsyncIterator[str]:
+    """
+    Streaming variant of generate_conversational_response - yields text as Gemini produces it
+    Joined (and stripped) the chunks equal the message generate_conversational_response would return
+    """
+    
+    prompt, system_instruction = _conversation_request(
+        state, user_message, next_question, is_closing,
+        company_name, founder_name, chat_history, was_irrelevant
+    )
+    
+    streamed = ""
+    # Trailing "."/"!"/whitespace is held back until more text arrives - it may need replacing with "?"
+    held = ""
+    try:
+        async for chunk in _stream_content(
+            model='gemini-2.5-flash',
+            contents=prompt,
+            config=GenerateContentConfig(
+                system_instruction=system_instruction,
+                temperature=0.8,
+                max_output_tokens=5000
+            )
+        ):
+            text = chunk.text
+            if not text:
+                continue
+            if not streamed:
+                text = text.lstrip()
+            streamed += text
+            text = held + text
+            body = _END_PUNCT_RE.sub('', text)
+            held = text[len(body):]
+            if body:
+                yield body
+    except Exception as e:
+        logger.warning("Conversation stream error: %s", e)
+    
+    if not streamed.strip():
+        # Nothing usable was sent - fall back to the canned message
+        yield _fallback_response(next_question, is_closing, company_name, founder_name)
+        return
+    
+    # Ensure question mark if not closing
+    if not is_closing and not streamed.rstrip().endswith('?'):
+        yield '?'
+    elif held:
+        yield held
 
 
 # ===== MAIN CHAT FUNCTION =====
 
-async def chat_with_founder(
+def _turn_result(state: InterviewState, progress: Dict[str, Any], is_complete: bool) -> Dict[str, Any]:
+    """Interview tracking fields the router persists after each turn"""
+    return {
+        "is_complete": is_complete,
+        "progress": progress,
+        "gathered_info": state.gathered_info,
+        "cannot_answer_fields": list(state.cannot_answer),
+        "asked_questions": list(state.asked_questions),
+        "ask_count": state.ask_count
+    }
+
+
+async def _process_turn(
     interview_data: Dict[str, Any],
     user_message: str,
     chat_history: List[Dict[str, str]]
-) -> Dict[str, Any]:
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
-    Main interview chat function - RELIABLE & PREDICTABLE
-    
-    Features:
-    - Never repeats questions
-    - Deterministic completion (pure math)
-    - Validates answer relevance
-    - Re-asks up to 2 times for irrelevant answers
-    - No LLM control over completion
+    Record the founder's answer and pick what to ask next
+    Returns (turn result for the router, kwargs for generating Sarah's reply)
     """
     
     # Initialize state
     state = InterviewState(interview_data)
     
-    company_name = interview_data.get('company_name', 'your startup')
-    founder_name = interview_data.get('founder_name', 'Founder')
+    # Sliced once - everything below only needs the tail of a possibly long interview
+    chat_history = chat_history[-HISTORY_WINDOW:]
     
     # Get progress
     progress = state.get_progress()
     
-    print(f"\n{'='*60}")
-    print(f"📊 INTERVIEW STATE")
-    print(f"{'='*60}")
-    print(f"Total questions: {progress['total']}")
-    print(f"Answered: {progress['answered']}")
-    print(f"Cannot answer: {progress['cannot_answer']}")
-    print(f"Attempted: {progress['attempted']}/{progress['total']}")
-    print(f"Remaining: {progress['remaining']}")
-    print(f"Complete: {progress['is_complete']}")
+    logger.debug(
+        "Interview state: total=%d answered=%d cannot_answer=%d attempted=%d remaining=%d complete=%s",
+        progress['total'], progress['answered'], progress['cannot_answer'],
+        progress['attempted'], progress['remaining'], progress['is_complete']
+    )
     
     # If complete, send closing message
     if progress['is_complete']:
-        print("✅ Interview complete - sending closing message")
+        logger.info("Interview complete - sending closing message")
         
-        closing_message = await generate_conversational_response(
+        reply_args = dict(
             state=state,
             user_message=user_message,
             next_question=None,
             is_closing=True,
-            company_name=company_name,
-            founder_name=founder_name,
+            company_name=state.company_name,
+            founder_name=state.founder_name,
             chat_history=chat_history
         )
         
-        return {
-            "message": closing_message,
-            "is_complete": True,
-            "progress": progress,
-            "gathered_info": state.gathered_info,
-            "cannot_answer_fields": list(state.cannot_answer),
-            "asked_questions": list(state.asked_questions),
-            "ask_count": state.ask_count
-        }
+        return _turn_result(state, progress, True), reply_args
     
     # Analyze user's latest response
     response_analysis = analyze_user_response(user_message)
     
-    print(f"\n📝 USER RESPONSE ANALYSIS")
-    print(f"Don't know: {response_analysis['is_dont_know']}")
-    print(f"Has substance: {response_analysis['has_substance']}")
-    print(f"Has numbers: {response_analysis['has_numbers']}")
+    logger.debug(
+        "User response analysis: dont_know=%s has_substance=%s has_numbers=%s",
+        response_analysis['is_dont_know'], response_analysis['has_substance'], response_analysis['has_numbers']
+    )
     
     # Get the LAST question we asked (from chat history)
     last_assistant_message = None
@@ -843,44 +1223,68 @@ async def chat_with_founder(
             break
     
     # Try to find which field we were asking about
+    # Only still-pending issues can have been asked last, so answered/skipped ones are filtered out first
     current_field = None
-    for issue in state.all_issues:
-        # Simple heuristic: if question text is in last assistant message
-        if last_assistant_message and issue['question'].lower() in last_assistant_message.lower():
-            current_field = issue['field']
-            break
+    if last_assistant_message:
+        last_asked = last_assistant_message.lower()
+        for issue in state.pending_issues():
+            # Simple heuristic: if question text is in last assistant message
+            if issue['question'].lower() in last_asked:
+                current_field = issue['field']
+                break
     
     # Track if answer was irrelevant (for conversational response)
     was_irrelevant = False
     
     # Process response
     if current_field:
-        print(f"🎯 Processing answer for: {current_field}")
+        logger.debug("Processing answer for: %s", current_field)
         
         if response_analysis['is_dont_know']:
             # Mark as cannot answer
             state.mark_cannot_answer(current_field)
-            print(f"   → Marked as 'cannot answer'")
+            logger.debug("%s marked as 'cannot answer'", current_field)
+        
+        elif response_analysis['is_numeric_answer'] and is_numeric_field(current_field):
+            # A bare figure answers a numeric question directly - record it without validation/extraction calls
+            state.add_answer(field=current_field, value=user_message.strip(), confidence='medium')
+            logger.debug("Recorded numeric answer for %s: %s", current_field, user_message.strip())
         
-        elif response_analysis['has_substance']:
-            # Validate if answer is relevant
-            validation = await validate_answer_relevance(
+        elif response_analysis['has_substance'] or response_analysis['is_numeric_answer']:
+            # One call judges relevance and extracts the value
+            # (a bare figure for a non-numeric field, e.g. "5" to "who are your competitors?", is judged here too)
+            validation = extracted = await assess_answer(
                 user_message=user_message,
-                question=last_assistant_message or "",
-                field_name=current_field
+                current_field=current_field,
+                question=last_assistant_message or ""
             )
             
-            print(f"   🔍 Relevance check:")
-            print(f"      - Relevant: {validation['is_relevant']}")
-            print(f"      - Reason: {validation.get('reason', 'N/A')}")
-            print(f"      - Is joke: {validation.get('is_joke', False)}")
-            print(f"      - Off-topic: {validation.get('is_offtopic', False)}")
+            if validation is None:
+                # Fallback: separate calls in parallel - extraction is discarded if irrelevant
+                validation, extracted = await asyncio.gather(
+                    validate_answer_relevance(
+                        user_message=user_message,
+                        question=last_assistant_message or "",
+                        field_name=current_field
+                    ),
+                    extract_info_from_response(
+                        user_message=user_message,
+                        current_field=current_field,
+                        question=last_assistant_message or ""
+                    )
+                )
+            
+            logger.debug(
+                "Relevance check for %s: relevant=%s reason=%s joke=%s offtopic=%s",
+                current_field, validation['is_relevant'], validation.get('reason', 'N/A'),
+                validation.get('is_joke', False), validation.get('is_offtopic', False)
+            )
             
             if not validation['is_relevant']:
                 # Answer is irrelevant/joke/off-topic
                 was_irrelevant = True
                 ask_count = state.get_ask_count(current_field)
-                print(f"   ⚠️ Irrelevant answer (asked {ask_count} times)")
+                logger.debug("Irrelevant answer for %s (asked %d times)", current_field, ask_count)
                 
                 # Mark as asked to increment count
                 state.mark_question_asked(current_field)
@@ -888,76 +1292,99 @@ async def chat_with_founder(
                 # If asked twice already, mark as cannot answer
                 if ask_count >= 1:  # This was the 2nd attempt
                     state.mark_cannot_answer(current_field)
-                    print(f"   → Asked twice, marking as 'cannot answer'")
+                    logger.debug("%s asked twice, marking as 'cannot answer'", current_field)
                 
             else:
-                # Answer is relevant - try to extract info
-                extracted = await extract_info_from_response(
-                    user_message=user_message,
-                    current_field=current_field,
-                    question=last_assistant_message or ""
-                )
-                
+                # Answer is relevant - use the extraction that ran alongside validation
                 if extracted and extracted.get('has_answer'):
                     state.add_answer(
                         field=current_field,
                         value=extracted.get('value'),
                         confidence=extracted.get('confidence', 'medium')
                     )
-                    print(f"   ✅ Extracted: {extracted.get('value')} (confidence: {extracted.get('confidence')})")
+                    logger.debug("Extracted %s: %s (confidence: %s)", current_field, extracted.get('value'), extracted.get('confidence'))
                 else:
                     # Relevant but vague answer - mark as cannot answer
                     state.mark_cannot_answer(current_field)
-                    print(f"   → Too vague, marked as 'cannot answer'")
+                    logger.debug("%s too vague, marked as 'cannot answer'", current_field)
         
         else:
             # Very short answer with no substance
-            print(f"   → Too short, no substance")
+            logger.debug("%s answer too short, no substance", current_field)
             state.mark_question_asked(current_field)
     
     # Get next question to ask
     next_question = state.get_next_question()
     
     if next_question:
-        print(f"\n🔜 NEXT QUESTION: {next_question['field']}")
-        print(f"   → {next_question['question']}")
-        print(f"   → Ask count: {next_question.get('ask_count', 0)}")
+        logger.debug(
+            "Next question: %s (ask count %d) - %s",
+            next_question['field'], next_question.get('ask_count', 0), next_question['question']
+        )
         
         # Mark as asked
         if not was_irrelevant:  # Don't double-increment if already marked
             state.mark_question_asked(next_question['field'])
     else:
-        print(f"\n✅ No more questions to ask")
+        logger.debug("No more questions to ask")
     
     # Check if we're done now
     progress = state.get_progress()
     is_closing = progress['is_complete']
     
-    print(f"\n📊 UPDATED PROGRESS:")
-    print(f"   Attempted: {progress['attempted']}/{progress['total']}")
-    print(f"   Closing: {is_closing}")
+    logger.debug("Updated progress: attempted=%d/%d closing=%s", progress['attempted'], progress['total'], is_closing)
     
-    # Generate response
-    ai_message = await generate_conversational_response(
+    reply_args = dict(
         state=state,
         user_message=user_message,
         next_question=next_question,
         is_closing=is_closing,
-        company_name=company_name,
-        founder_name=founder_name,
+        company_name=state.company_name,
+        founder_name=state.founder_name,
         chat_history=chat_history,
         was_irrelevant=was_irrelevant
     )
     
-    print(f"\n💬 AI RESPONSE: {ai_message[:100]}...")
-    print(f"{'='*60}\n")
+    return _turn_result(state, progress, is_closing), reply_args
+
+
+async def chat_with_founder(
+    interview_data: Dict[str, Any],
+    user_message: str,
+    chat_history: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """
+    Main interview chat function - RELIABLE & PREDICTABLE
     
-    return {
-        "message": ai_message,
-        "is_complete": is_closing,
-        "progress": progress,
-        "gathered_info": state.gathered_info,
-        "cannot_answer_fields": list(state.cannot_answer),
-        "asked_questions": list(state.asked_questions),
-        "ask_count": state.ask_count
-    }
+    Features:
+    - Never repeats questions
+    - Deterministic completion (pure math)
+    - Validates answer relevance
+    - Re-asks up to 2 times for irrelevant answers
+    - No LLM control over completion
+    """
+    
+    result, reply_args = await _process_turn(interview_data, user_message, chat_history)
+    
+    # Generate response
+    ai_message = await generate_conversational_response(**reply_args)
+    
+    logger.debug("AI response: %.100s", ai_message)
+    
+    return {"message": ai_message, **result}
+
+
+async def stream_chat_with_founder(
+    interview_data: Dict[str, Any],
+    user_message: str,
+    chat_history: List[Dict[str, str]]
+) -> Tuple[Dict[str, Any], AsyncIterator[str]]:
+    """
+    Streaming variant of chat_with_founder
+    The answer is processed up front (the next question depends on it); Sarah's reply is then
+    returned as a text stream. The result dict has every chat_with_founder key except "message".
+    """
+    
+    result, reply_args = await _process_turn(interview_data, user_message, chat_history)
+    
+    return result, stream_conversational_response(**reply_args)
@@ -4,6 +4,8 @@ from datetime import datetime, timedelta
 import secrets
 import json
 from config.settings import settings
+from . import json_utils
+from .json_utils import strip_fences
 from google import genai
 from google.genai.types import GenerateContentConfig
 
@@ -15,6 +17,12 @@ client = genai.Client(
 
 db = firestore.Client(project=settings.GCP_PROJECT_ID)
 
+# Interview question order - most important first, same-topic questions kept together
+IMPORTANCE_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+def issue_priority(issue: Dict[str, Any]) -> Tuple[int, str]:
+    return (IMPORTANCE_RANK.get(issue.get('importance'), len(IMPORTANCE_RANK)), issue.get('category', ''))
+
 def generate_interview_token() -> str:
     """Generate secure unique token for interview"""
     return secrets.token_urlsafe(32)
@@ -94,7 +102,7 @@ def identify_missing_and_shallow_fields(deal_data: Dict[str, Any]) -> Dict[str,
     stage = metadata.get('stage', 'Unknown')
     
     # Build memo JSON safely
-    memo_json = json.dumps(memo, indent=2)
+    memo_json = json_utils.dumps(memo)
     
     # Build prompt without raw newlines in f-string
     analysis_prompt = f"""You are an experienced VC analyst reviewing an investment memo for completeness and depth.
@@ -183,19 +191,11 @@ Only return valid JSON, nothing else:"""
         )
         
         print("Response Text: ",response.text)
-        response_text = response.text.strip()
-        
         # Clean up response if it has markdown code blocks
-        if response_text.startswith('```json'):
-            response_text = response_text[7:]  # Remove ```json
-        if response_text.startswith('```'):
-            response_text = response_text[3:]  # Remove ```
-        if response_text.endswith('```'):
-            response_text = response_text[:-3]  # Remove trailing ```
+        response_text = strip_fences(response.text)
         
-        # response_text = response_text.strip()
         print("Final Text: ",response_text)
-        issues = json.loads(response_text)
+        issues = json_utils.loads(response_text)
         
         print(f"📊 Gap Analysis Complete:")
         print(f"   - Missing: {len(issues.get('missing', []))}")
@@ -241,8 +241,8 @@ def generate_draft_interview(deal_id: str) -> bool:
             issue['status'] = category
             all_issues.append(issue)
             
-    importance_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-    all_issues.sort(key=lambda x: importance_order.get(x['importance'], 999))
+    # Sorted once here and stored - the chat turns just walk this order
+    all_issues.sort(key=issue_priority)
     
     if not all_issues:
         print(f"[{deal_id}] No issues found, skipping interview generation")
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from typing import Dict, Any
 from datetime import datetime
@@ -5,6 +6,8 @@ from fastapi import HTTPException
 from google import genai
 from google.genai.types import GenerateContentConfig, Tool, GoogleSearch
 from config.settings import settings
+from . import json_utils
+from .json_utils import strip_fences
 
 # Initialize Google Gen AI client
 client = genai.Client(api_key=settings.GEMINI_API_KEY)
@@ -63,16 +66,16 @@ YOUR INVESTMENT PHILOSOPHY: Back exceptional founders solving real problems in l
 - Market Size: {market_size}
 
 **Our Analysis Summary:**
-{json.dumps(memo.get('conclusion', {}), indent=2)}
+{json_utils.dumps(memo.get('conclusion', {}))}
 
 **Financial Details:**
-{json.dumps(financials, indent=2)[:1500]}
+{json_utils.dumps(financials)[:1500]}
 
 **Market Understanding:**
-{json.dumps(memo.get('market_analysis', {}), indent=2)[:2000]}
+{json_utils.dumps(memo.get('market_analysis', {}))[:2000]}
 
 **The Team:**
-{json.dumps(founders, indent=2)[:1000]}
+{json_utils.dumps(founders)[:1000]}
 
 **From Their Pitch:**
 {extracted_text[:5000]}
@@ -368,7 +371,8 @@ Return ONLY valid JSON. No markdown formatting.
 
 
         # Call Gemini with Google Search grounding
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model='gemini-3-pro-preview',
             contents=prompt,
             config=GenerateContentConfig(
@@ -384,12 +388,9 @@ Return ONLY valid JSON. No markdown formatting.
         response_text = response.text.strip()
         
         # Remove markdown if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:-3].strip()
-        elif response_text.startswith("```"):
-            response_text = response_text[3:-3].strip()
+        response_text = strip_fences(response_text)
         
-        decision = json.loads(response_text)
+        decision = json_utils.loads(response_text)
         
         # Add metadata
         decision['deal_id'] = deal_id
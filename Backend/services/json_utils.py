@@ -0,0 +1,19 @@
+import orjson
+
+def strip_fences(text: str) -> str:
+    """Remove markdown code fences (```json ... ```) that models sometimes wrap JSON in"""
+    return text.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+def loads(text: str):
+    """
+    Parse a JSON model response with orjson (~2-3x faster than json on large memos)
+    Raises orjson.JSONDecodeError, a subclass of json.JSONDecodeError
+    """
+    return orjson.loads(text)
+
+def dumps(obj) -> str:
+    """
+    Compact JSON for embedding memos/history in prompts
+    No indent - pretty-printing only costs serialization time and prompt tokens
+    """
+    return orjson.dumps(obj).decode()
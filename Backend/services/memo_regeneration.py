@@ -1,7 +1,10 @@
 from google import genai
 from google.genai.types import GenerateContentConfig
 from config.settings import settings
+from . import json_utils
+from .json_utils import strip_fences
 from google.cloud import firestore
+import asyncio
 import json
 
 client = genai.Client(
@@ -106,7 +109,7 @@ async def merge_memo_with_interview_data(
     sector = deal_metadata.get('sector', 'Unknown')
     
     # ✅ Properly escape memo
-    memo_json = json.dumps(original_memo, indent=2)
+    memo_json = json_utils.dumps(original_memo)
     
     merge_prompt = f"""You are an expert investment analyst. You need to UPDATE an investment memo by merging information from a pitch deck analysis with insights gathered from a founder interview.
 
@@ -193,7 +196,8 @@ Create an UPDATED investment memo that:
 Return the complete updated memo in the exact same JSON structure (VALID JSON only):"""
     
     try:
-        response = client.models.generate_content(
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model='gemini-3-pro-preview',
             contents=merge_prompt,
             config=GenerateContentConfig(
@@ -214,18 +218,11 @@ Return the complete updated memo in the exact same JSON structure (VALID JSON on
             raise ValueError("API returned empty response")
         
         # ✅ Clean markdown
-        if response_text.startswith('```json'):
-            response_text = response_text[7:]
-        if response_text.startswith('```'):
-            response_text = response_text[3:]
-        if response_text.endswith('```'):
-            response_text = response_text[:-3]
-        
-        response_text = response_text.strip()
+        response_text = strip_fences(response_text)
         
         # ✅ Parse with error handling
         try:
-            updated_memo = json.loads(response_text)
+            updated_memo = json_utils.loads(response_text)
             print("✅ Memo successfully merged with interview data")
             return updated_memo
         except json.JSONDecodeError as e:
@@ -0,0 +1,24 @@
+from typing import Tuple
+import tempfile
+import fitz
+from google.cloud import storage
+
+# Below this many characters per page the PDF is likely scanned images and needs OCR
+MIN_CHARS_PER_PAGE = 50
+
+def fast_extract(path: str) -> Tuple[str, int]:
+    """Extract the embedded text layer of a PDF file with PyMuPDF - no OCR, milliseconds per deck"""
+    with fitz.open(path, filetype="pdf") as doc:
+        text = "\n".join(page.get_text("text") for page in doc)
+        return text, len(doc)
+
+def fast_extract_blob(blob: storage.Blob) -> Tuple[str, int]:
+    """Spool a GCS blob to a temp file and extract it there - the deck is never held in memory whole"""
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as spool:
+        blob.download_to_file(spool)
+        spool.flush()
+        return fast_extract(spool.name)
+
+def is_text_native(text: str, pages: int) -> bool:
+    """True when the text layer is dense enough to skip Document AI"""
+    return pages > 0 and len(text.strip()) / pages >= MIN_CHARS_PER_PAGE
@@ -1,16 +1,86 @@
 import secrets
+from typing import Optional
 from google.cloud import storage
+from streaming_form_data.targets import BaseTarget
 from config.settings import settings
 
 storage_client = storage.Client(project=settings.GCP_PROJECT_ID)
 bucket = storage_client.bucket(settings.GCS_BUCKET_NAME)
 
+_GCS_URI_PREFIX = f"gs://{settings.GCS_BUCKET_NAME}/"
+
+# Resumable upload chunk size - GCS requires a multiple of 256 KiB; the writer holds at most this much
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 def generate_deal_id() -> str:
     """Generate a unique 6-character deal ID"""
     return secrets.token_hex(3)
 
+def as_uri(path: str) -> str:
+    """gs:// URI for an object path - for APIs (Document AI, Gemini) that read from GCS"""
+    return f"{_GCS_URI_PREFIX}{path}"
+
+def object_path(stored: str) -> str:
+    """Object path from a stored file reference - older deals hold the full gs:// URI"""
+    return stored.removeprefix(_GCS_URI_PREFIX)
+
 def upload_to_gcs(file_content: bytes, destination_path: str) -> str:
-    """Upload file to Google Cloud Storage"""
+    """Upload file to Google Cloud Storage and return its object path"""
     blob = bucket.blob(destination_path)
     blob.upload_from_string(file_content)
-    return f"gs://{settings.GCS_BUCKET_NAME}/{destination_path}"
+    return destination_path
+
+def resolve_mime_type(content_type: Optional[str], filename: Optional[str]) -> str:
+    """Map generic upload content types to a concrete mime type using the file extension"""
+    mime_type = content_type or "application/octet-stream"
+
+    if mime_type == "application/octet-stream" and filename:
+        if filename.endswith(".pdf"):
+            mime_type = "application/pdf"
+        elif filename.endswith(".mp4"):
+            mime_type = "video/mp4"
+        elif filename.endswith(".mp3"):
+            mime_type = "audio/mpeg"
+
+    return mime_type
+
+def pitch_deck_path(deal_id: str, mime_type: str) -> str:
+    """GCS object path for a deal's pitch deck based on its mime type"""
+    extension = "bin"
+    if "pdf" in mime_type: extension = "pdf"
+    elif "video" in mime_type: extension = "mp4"
+    elif "audio" in mime_type: extension = "mp3"
+
+    return f"deals/{deal_id}/pitch_deck.{extension}"
+
+class GCSUploadTarget(BaseTarget):
+    """
+    streaming_form_data target that uploads a file part to GCS as a resumable upload
+    At most UPLOAD_CHUNK_SIZE bytes are buffered before each chunk is sent; the writes block,
+    so feed the parser from a worker thread
+    The object path is resolved once the part headers (content type, filename) are known
+    """
+
+    def __init__(self, deal_id: str):
+        super().__init__()
+        self.deal_id = deal_id
+        self.mime_type = None
+        self.gcs_path = None
+        self._writer = None
+
+    @property
+    def received(self) -> bool:
+        return self.gcs_path is not None
+
+    def on_start(self):
+        self.mime_type = resolve_mime_type(self.multipart_content_type, self.multipart_filename)
+        self.gcs_path = pitch_deck_path(self.deal_id, self.mime_type)
+        self._writer = bucket.blob(self.gcs_path).open(
+            "wb", content_type=self.mime_type, chunk_size=UPLOAD_CHUNK_SIZE
+        )
+
+    def on_data_received(self, chunk: bytes):
+        self._writer.write(chunk)
+
+    def on_finish(self):
+        self._writer.close()
@@ -244,10 +244,9 @@ def create_word_document(analysis: Dict[str, Any], deal_id: str) -> str:
         blob = bucket.blob(blob_path)
         blob.upload_from_filename(temp_path)
         
-        gcs_url = f"gs://{settings.GCS_BUCKET_NAME}/{blob_path}"
-        print(f"Word document uploaded to: {gcs_url}")
+        print(f"Word document uploaded to: {blob_path}")
         
-        return gcs_url
+        return blob_path
     
     except Exception as e:
         print(f"Error creating Word document: {str(e)}")
@@ -0,0 +1,20 @@
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Tests run from Backend/ like the app itself (imports are `services.*`, `routers.*`)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Required settings - dummy values, nothing talks to GCP in tests
+for key, value in {
+    "GCP_PROJECT_ID": "test-project",
+    "DOCUMENT_AI_PROCESSOR_ID": "test-processor",
+    "BREVO_API_KEY": "test",
+    "GEMINI_API_KEY": "test",
+}.items():
+    os.environ.setdefault(key, value)
+
+# Cloud clients are created at import time - replace them before any app module is imported
+for target in ("google.cloud.firestore.Client", "google.cloud.storage.Client", "google.genai.Client"):
+    mock.patch(target).start()
@@ -0,0 +1,25 @@
+from services.chunking import build_context, hybrid_chunk
+
+
+def _deck(paragraphs: int = 40) -> str:
+    return "\n\n".join(
+        f"Slide {i}\n" + " ".join(f"Point {i}.{j} about the market." for j in range(20))
+        for i in range(paragraphs)
+    )
+
+
+def test_no_overlap_chunks_rejoin_to_the_deck():
+    text = _deck()
+    chunks = hybrid_chunk(text, overlap=0)
+
+    assert len(chunks) > 1
+    assert "".join(chunks).replace("\n", "").replace(" ", "") == text.replace("\n", "").replace(" ", "")
+
+
+def test_build_context_fills_budget_with_a_partial_last_section():
+    budget = 5000
+    context = build_context(hybrid_chunk(_deck(), size=1500, overlap=0), budget)
+
+    # The whole budget is used up to the last sentence boundary, not the last whole chunk
+    assert budget - 100 < len(context) <= budget
+    assert context.endswith(".")
@@ -0,0 +1,44 @@
+from services.gemini_service import _validate_metadata
+
+
+def test_null_founders_in_overview_yields_empty_list():
+    analysis = {
+        "metadata": {"company_name": "Acme", "founder_names": [], "sector": "Fintech"},
+        "company_overview": {"founders": None},
+    }
+
+    assert _validate_metadata(analysis) == {
+        "company_name": "Acme",
+        "founder_names": [],
+        "sector": "Fintech",
+    }
+
+
+def test_string_founder_names_is_wrapped():
+    analysis = {"metadata": {"company_name": "Acme", "founder_names": "Jane Doe", "sector": "Fintech"}}
+
+    assert _validate_metadata(analysis)["founder_names"] == ["Jane Doe"]
+
+
+def test_missing_metadata_is_backfilled_from_overview():
+    analysis = {
+        "company_overview": {
+            "name": "Acme",
+            "sector": "Fintech",
+            "founders": [{"name": "Jane Doe"}, {"role": "CTO"}, "not a dict"],
+        }
+    }
+
+    assert _validate_metadata(analysis) == {
+        "company_name": "Acme",
+        "founder_names": ["Jane Doe"],
+        "sector": "Fintech",
+    }
+
+
+def test_missing_everything_falls_back_to_unknown():
+    assert _validate_metadata({}) == {
+        "company_name": "Unknown",
+        "founder_names": [],
+        "sector": "Unknown",
+    }
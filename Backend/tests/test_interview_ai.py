@@ -0,0 +1,37 @@
+import asyncio
+
+from services import interview_ai
+
+
+def _interview(field: str, question: str) -> dict:
+    return {"company_name": "Acme", "issues": [{"field": field, "question": question}]}
+
+
+def _run_turn(monkeypatch, field: str, question: str, user_message: str):
+    assessed = []
+
+    async def fake_assess_answer(user_message, current_field, question):
+        assessed.append(current_field)
+        return {"is_relevant": True, "has_answer": True, "value": user_message, "confidence": "high"}
+
+    monkeypatch.setattr(interview_ai, "assess_answer", fake_assess_answer)
+
+    chat_history = [{"role": "assistant", "message": f"Thanks! {question}"}]
+    result, _ = asyncio.run(
+        interview_ai._process_turn(_interview(field, question), user_message, chat_history)
+    )
+    return result, assessed
+
+
+def test_bare_number_for_non_numeric_field_is_assessed(monkeypatch):
+    result, assessed = _run_turn(monkeypatch, "main_competitors", "Who are your main competitors?", "5")
+
+    assert assessed == ["main_competitors"]
+    assert result["gathered_info"]["main_competitors"]["confidence"] == "high"
+
+
+def test_bare_number_for_numeric_field_skips_assessment(monkeypatch):
+    result, assessed = _run_turn(monkeypatch, "current_mrr", "What is your current MRR?", "$50k")
+
+    assert assessed == []
+    assert result["gathered_info"]["current_mrr"]["value"] == "$50k"
@@ -0,0 +1,55 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import interviews
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(interviews.router)
+    return app
+
+
+def test_completing_interview_schedules_memo_regeneration(monkeypatch):
+    interview = {
+        "deal_id": "abc123",
+        "company_name": "Acme",
+        "issues": [{"field": "current_mrr", "question": "What is your MRR?"}],
+        "chat_history": [],
+        "missing_fields": ["current_mrr"],
+    }
+    monkeypatch.setattr(interviews, "validate_interview_token", lambda token: interview)
+
+    async def fake_chat_with_founder(interview_data, user_message, chat_history):
+        return {
+            "message": "Thank you so much for your time!",
+            "is_complete": True,
+            "progress": {"attempted": 1, "total": 1},
+            "gathered_info": {"current_mrr": {"value": "$50k", "confidence": "high"}},
+            "cannot_answer_fields": [],
+            "asked_questions": ["current_mrr"],
+            "ask_count": {"current_mrr": 1},
+        }
+
+    monkeypatch.setattr(interviews, "chat_with_founder", fake_chat_with_founder)
+
+    scheduled = []
+
+    def fake_regenerate(deal_id):
+        # Recorded when complete_interview schedules the coroutine, not when it runs
+        scheduled.append(deal_id)
+        return asyncio.sleep(0)
+
+    monkeypatch.setattr("services.memo_regeneration.regenerate_memo_with_interview", fake_regenerate)
+
+    with TestClient(_app()) as client:
+        response = client.post(
+            "/api/interviews/chat",
+            json={"message": "About $50k a month", "interview_token": "token"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["is_complete"] is True
+    assert scheduled == ["abc123"]